@@ -5,6 +5,9 @@ This script processes audio files from Azure Blob Storage through VoiceGain
 and saves transcripts. No dashboard, no complex setup - just run it.
 
 Configuration: Edit the values at the top of this file.
+
+Setup: install the shared workflow package once from the repository root
+with `pip install -e .`
 """
 
 import os
@@ -12,9 +15,13 @@ import sys
 import logging
 import time
 import json
+import re
+from collections import deque
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-from threading import Lock
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Event, Lock
+from urllib.parse import quote
 
 # ============================================================================
 # CONFIGURATION - Edit these values
@@ -32,6 +39,30 @@ CONTAINER_NAME = "audiofiles"
 # Maximum number of files to process (None = process all files)
 MAX_FILES = None  # Set to a number like 10000 to limit processing
 
+# Number of files kept in flight at once. Each worker spends most of its time
+# waiting on VoiceGain polling, so this can be well above the CPU count.
+MAX_WORKERS = 32
+
+# Number of top-level folders listed in parallel while scanning the container
+LISTING_WORKERS = 16
+
+# Blobs requested per List Blobs page (5000 is the service maximum)
+LIST_PAGE_SIZE = 5000
+
+# Top-level folders that hold already-processed files; these are never listed
+EXCLUDED_FOLDERS = frozenset({'Archive/', 'Processed/', 'Transcripts/'})
+
+# Archived source blobs are deleted in Blob Batch requests of this size (service maximum)
+ARCHIVE_DELETE_BATCH_SIZE = 256
+
+# How long to wait for an archive copy the service reports as still pending
+ARCHIVE_COPY_MAX_WAIT_SECONDS = 30
+
+# Transcript uploads: payloads up to this size are sent as a single PUT
+UPLOAD_MAX_SINGLE_PUT_SIZE = 4 * 1024 * 1024
+# Block size used if a transcript is ever larger than the single-put size
+UPLOAD_MAX_BLOCK_SIZE = 1024 * 1024
+
 # ============================================================================
 # RATE LIMITING CONFIGURATION
 # ============================================================================
@@ -39,11 +70,27 @@ MAX_FILES = None  # Set to a number like 10000 to limit processing
 # Rate limit: 3750 files per hour
 MAX_FILES_PER_HOUR = 3750
 SECONDS_PER_HOUR = 3600
-MIN_DELAY_BETWEEN_SUBMISSIONS = max(1.0, SECONDS_PER_HOUR / MAX_FILES_PER_HOUR)
+SUBMISSIONS_PER_SECOND = MAX_FILES_PER_HOUR / SECONDS_PER_HOUR
+
+# Token bucket size: up to this many submissions may go out back to back
+# before the bucket's refill rate (the hourly average) paces them
+RATE_LIMIT_BURST = 60
 
 # Rate limiter state
 _rate_limiter_lock = Lock()
-_submission_times = []
+_submission_times = deque()  # Submission timestamps, oldest first
+_tokens = float(RATE_LIMIT_BURST)  # Token bucket level
+_last_refill = time.monotonic()
+
+# Container SAS shared by all blob URLs, regenerated before it expires
+SAS_REFRESH_SECONDS = 23 * 3600
+_container_sas_lock = Lock()
+_container_sas = None
+_container_sas_refresh_at = 0.0
+
+# Archived source blobs waiting to be deleted in a batch
+_pending_deletes_lock = Lock()
+_pending_deletes = []
 
 
 # ============================================================================
@@ -62,60 +109,85 @@ logger = logging.getLogger(__name__)
 # RATE LIMITING FUNCTION
 # ============================================================================
 
+def _expire_submission_times(now: float):
+    """Drop timestamps older than 1 hour (the deque is oldest-first, so only the head can expire)"""
+    while _submission_times and now - _submission_times[0] >= SECONDS_PER_HOUR:
+        _submission_times.popleft()
+
+
 def wait_for_rate_limit():
-    """Wait if necessary to respect rate limit of 3750 files/hour"""
-    global _submission_times
+    """
+    Wait if necessary to respect rate limit of 3750 files/hour.
     
-    with _rate_limiter_lock:
-        now = time.time()
-        # Remove timestamps older than 1 hour
-        _submission_times = [t for t in _submission_times if now - t < SECONDS_PER_HOUR]
-        
-        # If we've hit the limit, wait until oldest submission is 1 hour old
-        if len(_submission_times) >= MAX_FILES_PER_HOUR:
-            oldest_time = min(_submission_times)
-            wait_time = SECONDS_PER_HOUR - (now - oldest_time) + 1  # Add 1 second buffer
-            if wait_time > 0:
-                logger.info(f"Rate limit reached ({len(_submission_times)}/{MAX_FILES_PER_HOUR} per hour). Waiting {wait_time:.1f}s...")
-                time.sleep(wait_time)
-                # Clean up again after waiting
-                now = time.time()
-                _submission_times = [t for t in _submission_times if now - t < SECONDS_PER_HOUR]
-        
-        # Add current submission time
-        _submission_times.append(time.time())
-        
-        # Small delay between submissions to smooth out the rate
-        time.sleep(MIN_DELAY_BETWEEN_SUBMISSIONS)
+    A token bucket paces submissions at the hourly average while allowing
+    short bursts; the rolling one-hour window is the hard cap on top of it.
+    """
+    global _tokens, _last_refill
+    
+    # The lock only guards the bookkeeping; all sleeping happens outside it so
+    # other workers are not blocked while one waits.
+    while True:
+        with _rate_limiter_lock:
+            now = time.monotonic()
+            _tokens = min(RATE_LIMIT_BURST, _tokens + (now - _last_refill) * SUBMISSIONS_PER_SECOND)
+            _last_refill = now
+            _expire_submission_times(now)
+            
+            if len(_submission_times) < MAX_FILES_PER_HOUR:
+                # Take a token. If the bucket is empty this leaves it in debt and
+                # the caller waits until its token has refilled.
+                _tokens -= 1
+                delay = max(0.0, -_tokens / SUBMISSIONS_PER_SECOND)
+                _submission_times.append(now + delay)
+                break
+            
+            # Hit the limit: wait until oldest submission is 1 hour old, then re-check
+            wait_time = SECONDS_PER_HOUR - (now - _submission_times[0]) + 1  # Add 1 second buffer
+            logger.info(f"Rate limit reached ({len(_submission_times)}/{MAX_FILES_PER_HOUR} per hour). Waiting {wait_time:.1f}s...")
+        time.sleep(wait_time)
+    
+    if delay > 0:
+        time.sleep(delay)
 
 
 # ============================================================================
 # IMPORT DEPENDENCIES
 # ============================================================================
 
-# Add parent directory to path to import TranscriptionWorkflow
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-batch_path = os.path.join(parent_dir, 'amp_transcript_batch')
-
-if os.path.exists(batch_path):
-    sys.path.insert(0, batch_path)
-    logger.info("Using TranscriptionWorkflow from amp_transcript_batch")
-else:
-    logger.error(f"Could not find amp_transcript_batch directory at {batch_path}")
-    sys.exit(1)
-
+from azure.core.exceptions import ResourceNotFoundError
 from azure.storage.blob import (
-    BlobServiceClient, 
+    BlobPrefix,
+    BlobServiceClient,
+    ContainerClient,
     generate_container_sas, 
     ContainerSasPermissions
 )
-from function_app import TranscriptionWorkflow
+from amp_transcript_batch.function_app import TranscriptionWorkflow, _case_variant_suffixes
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson serializes straight to bytes and is much faster; fall back to json if not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ============================================================================
 # CUSTOM TRANSCRIPTION WORKFLOW
 # ============================================================================
 
+# Path separators flattened when turning a blob name into a transcript filename
+_SEP_TABLE = str.maketrans({'/': '_', '\\': '_'})
+
+# Audio extensions stripped from transcript filenames
+_AUDIO_FILE_EXTENSIONS = frozenset({'.mp3', '.wav', '.m4a'})
+
+# Any newline style (\r\n, \r or \n), so it can be doubled in one pass
+_NEWLINE_PATTERN = re.compile(r'\r\n?|\n')
+
+
 class SimpleTranscriptionWorkflow(TranscriptionWorkflow):
     """Extended TranscriptionWorkflow that saves formatted and raw transcripts"""
     
@@ -124,14 +196,26 @@ class SimpleTranscriptionWorkflow(TranscriptionWorkflow):
         voicegain_bearer_token: str,
         blob_connection_string: str,
         blob_container_name: str = "audiofiles",
-        output_folder: str = "Transcripts"
+        output_folder: str = "Transcripts",
+        http_session: Optional[requests.Session] = None
     ):
         super().__init__(
             voicegain_bearer_token=voicegain_bearer_token,
-            blob_connection_string=blob_connection_string,
-            blob_container_name=blob_container_name
+            blob_container_name=blob_container_name,
+            http_session=http_session
+        )
+        # Build the blob client here so uploads can be tuned for small transcripts:
+        # anything under the single-put size goes up in one request, larger
+        # payloads are chunked into small blocks instead of large buffers.
+        self.blob_service_client = BlobServiceClient.from_connection_string(
+            blob_connection_string,
+            max_single_put_size=UPLOAD_MAX_SINGLE_PUT_SIZE,
+            max_block_size=UPLOAD_MAX_BLOCK_SIZE
         )
+        self.container_client = self.blob_service_client.get_container_client(blob_container_name)
         self.output_folder = output_folder
+        self.formatted_prefix = f"{output_folder}/formatted/"
+        self.raw_prefix = f"{output_folder}/raw/"
     
     def save_transcript_to_blob(
         self, 
@@ -139,48 +223,44 @@ class SimpleTranscriptionWorkflow(TranscriptionWorkflow):
         audio_identifier: str, 
         raw_transcript_data: Optional[Dict[str, Any]] = None
     ) -> Optional[str]:
-        """Save formatted and raw transcripts to blob storage"""
+        """
+        Save formatted and raw transcripts to blob storage.
+        
+        Uploads happen inline rather than being staged locally for a later
+        bulk copy: the source audio is archived right after this returns, so
+        the transcript must already be durable in the container by then.
+        Throughput comes from the worker pool running many of these at once
+        over the shared container client.
+        """
         if not self.blob_service_client:
             logger.warning(f"Blob connection string not configured. Skipping upload for {audio_identifier}.")
             return None
 
-        # Sanitize the audio identifier for filename
-        sanitized_name = ""
-        base_name = ""
-        if ".mp3" in audio_identifier.lower():
-            base_name = audio_identifier.replace("/", "_").replace("\\", "_").replace(".mp3", "")
-            sanitized_name = base_name + ".txt"
-        elif ".wav" in audio_identifier.lower():
-            base_name = audio_identifier.replace("/", "_").replace("\\", "_").replace(".wav", "")
-            sanitized_name = base_name + ".txt"
-        elif ".m4a" in audio_identifier.lower():
-            base_name = audio_identifier.replace("/", "_").replace("\\", "_").replace(".m4a", "")
-            sanitized_name = base_name + ".txt"
-        else:
-            # For other formats, just replace path separators and add .txt
-            base_name = audio_identifier.replace("/", "_").replace("\\", "_")
-            sanitized_name = base_name + ".txt"
+        # Sanitize the audio identifier for filename: flatten path separators
+        # and drop the audio extension (in any case, e.g. .MP3)
+        sanitized_id = audio_identifier.translate(_SEP_TABLE)
+        root, ext = os.path.splitext(sanitized_id)
+        base_name = root if ext.lower() in _AUDIO_FILE_EXTENSIONS else sanitized_id
+        sanitized_name = base_name + ".txt"
 
-        container_client = self.blob_service_client.get_container_client(
-            self.blob_container_name
-        )
-        
         # Save formatted transcript (double-space lines for readability)
-        formatted_path = f"{self.output_folder}/formatted/{sanitized_name}"
-        blob_client = container_client.get_blob_client(formatted_path)
+        formatted_path = self.formatted_prefix + sanitized_name
         # Normalize newlines and insert an empty line before each existing newline
-        normalized_text = transcript_text.replace('\r\n', '\n').replace('\r', '\n')
-        formatted_text = normalized_text.replace('\n', '\n\n')
-        blob_client.upload_blob(formatted_text, overwrite=True)
-        logger.info(f"Formatted transcript saved to: {formatted_path}")
+        formatted_text = _NEWLINE_PATTERN.sub('\n\n', transcript_text)
+        self.container_client.upload_blob(formatted_path, formatted_text.encode('utf-8'), overwrite=True)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Formatted transcript saved to: {formatted_path}")
         
         # Save raw transcript JSON if provided
         if raw_transcript_data is not None:
-            raw_json = json.dumps(raw_transcript_data, indent=2)
-            raw_path = f"{self.output_folder}/raw/{base_name}.json"
-            raw_blob_client = container_client.get_blob_client(raw_path)
-            raw_blob_client.upload_blob(raw_json, overwrite=True)
-            logger.info(f"Raw transcript saved to: {raw_path}")
+            if orjson is not None:
+                raw_json = orjson.dumps(raw_transcript_data, option=orjson.OPT_INDENT_2)
+            else:
+                raw_json = json.dumps(raw_transcript_data, indent=2).encode('utf-8')
+            raw_path = f"{self.raw_prefix}{base_name}.json"
+            self.container_client.upload_blob(raw_path, raw_json, overwrite=True)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Raw transcript saved to: {raw_path}")
         
         return formatted_path
 
@@ -189,22 +269,49 @@ class SimpleTranscriptionWorkflow(TranscriptionWorkflow):
 # HELPER FUNCTIONS
 # ============================================================================
 
+def create_http_session() -> requests.Session:
+    """
+    Create the VoiceGain HTTP session shared by all workers.
+    
+    The connection pool is sized well above MAX_WORKERS so every concurrent
+    poll keeps its own kept-alive connection instead of opening a new TLS
+    connection per request. Transient 429/5xx responses to idempotent
+    requests (polls and transcript downloads) are retried with exponential
+    backoff; submissions are POSTs and are never retried automatically, so a
+    file cannot be submitted twice.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # Hand the last response back so the workflow's own status handling runs
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=2 * MAX_WORKERS, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+
 def list_audio_files_from_blob(
-    connection_string: str,
-    container_name: str,
+    container_client: ContainerClient,
     audio_extensions: Optional[List[str]] = None,
     max_files: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """
     List audio files from Azure Blob Storage container.
-    Excludes files already in Archive/, Processed/, or Transcripts/ folders.
+    Excludes files already in the EXCLUDED_FOLDERS (Archive/, Processed/, Transcripts/).
+    
+    The container root is listed with a '/' delimiter so each top-level
+    folder comes back as a single prefix entry; the folders are then listed
+    in parallel (one shard per folder), skipping the excluded ones entirely.
     """
     audio_extensions = audio_extensions or [".wav", ".mp3", ".m4a"]
+    audio_suffixes = _case_variant_suffixes(audio_extensions)
+    
+    container_name = container_client.container_name
     
     try:
-        blob_service_client = BlobServiceClient.from_connection_string(connection_string)
-        container_client = blob_service_client.get_container_client(container_name)
-        
         if not container_client.exists():
             logger.error(f"Container '{container_name}' does not exist")
             return []
@@ -212,53 +319,92 @@ def list_audio_files_from_blob(
         logger.info(f"Scanning container '{container_name}' for audio files...")
         logger.info("This may take several minutes with large containers...")
         
-        audio_files = []
-        blob_list = container_client.list_blobs()
-        
-        # Exclude files that are already processed
-        exclude_prefixes = ['Archive/', 'Processed/', 'Transcripts/']
+        log_interval = 30  # Log progress every 30 seconds
+        log_count_interval = 100000  # Also log every 100k blobs
+        
+        found_lock = Lock()
+        found_count = 0
+        scan_done = Event()
+        
+        def record_audio_file(blob_name: str, matches: List[Dict[str, Any]]) -> bool:
+            """Collect an audio blob; returns True once max_files has been reached."""
+            nonlocal found_count
+            matches.append({
+                "audiopath": blob_name,
+                "source_metadata": None
+            })
+            if not max_files:
+                return False
+            with found_lock:
+                found_count += 1
+                if found_count >= max_files:
+                    scan_done.set()
+            return scan_done.is_set()
+        
+        def scan_shard(prefix: str):
+            """List every blob under one top-level folder."""
+            matches: List[Dict[str, Any]] = []
+            scanned_count = 0
+            last_log_time = time.time()
+            
+            # Only names are needed, so skip deserializing full blob properties
+            for blob_name in container_client.list_blob_names(name_starts_with=prefix, results_per_page=LIST_PAGE_SIZE):
+                if scan_done.is_set():
+                    break
+                scanned_count += 1
+                
+                # Log progress periodically; the clock is only read every
+                # 1024 blobs to keep it out of the per-blob path
+                should_log = False
+                if scanned_count & 0x3FF == 0:
+                    current_time = time.time()
+                    if current_time - last_log_time >= log_interval:
+                        should_log = True
+                        last_log_time = current_time
+                if scanned_count % log_count_interval == 0:
+                    should_log = True
+                
+                if should_log:
+                    logger.info(f"Scanning '{prefix}'... checked {scanned_count:,} blobs, found {len(matches):,} audio files so far...")
+                
+                if blob_name.endswith(audio_suffixes):
+                    if record_audio_file(blob_name, matches):
+                        break
+            
+            return matches, scanned_count
         
+        audio_files = []
         scanned_count = 0
-        last_log_time = time.time()
-        log_interval = 30  # Log progress every 30 seconds
-        log_count_interval = 10000  # Also log every 10k blobs
         
         logger.info("Starting blob iteration...")
-        sys.stdout.flush()
         
-        for blob in blob_list:
-            scanned_count += 1
-            blob_name = blob.name.lower()
-            
-            # Log progress periodically
-            current_time = time.time()
-            should_log = False
-            if current_time - last_log_time >= log_interval:
-                should_log = True
-                last_log_time = current_time
-            elif scanned_count % log_count_interval == 0:
-                should_log = True
-            
-            if should_log:
-                logger.info(f"Scanning... checked {scanned_count:,} blobs, found {len(audio_files):,} audio files so far...")
-                sys.stdout.flush()
-            
-            # Skip files in Archive, Processed, or Transcripts folders
-            if any(blob.name.startswith(exclude) for exclude in exclude_prefixes):
-                continue
+        with ThreadPoolExecutor(max_workers=LISTING_WORKERS) as executor:
+            shard_futures = {}
             
-            if any(blob_name.endswith(ext) for ext in audio_extensions):
-                audio_files.append({
-                    "audiopath": blob.name,
-                    "source_metadata": None
-                })
-                
-                # Stop scanning if we've reached the max_files limit
-                if max_files and len(audio_files) >= max_files:
-                    logger.info(f"Reached max_files limit ({max_files:,}). Stopping scan early.")
-                    logger.info(f"Found {len(audio_files):,} audio files (scanned {scanned_count:,} total blobs)")
-                    sys.stdout.flush()
+            # Root-level blobs are handled here; each folder becomes a shard
+            for item in container_client.walk_blobs(delimiter='/', results_per_page=LIST_PAGE_SIZE):
+                if scan_done.is_set():
                     break
+                if isinstance(item, BlobPrefix):
+                    # Skip Archive, Processed, and Transcripts without listing them
+                    if item.name not in EXCLUDED_FOLDERS:
+                        shard_futures[executor.submit(scan_shard, item.name)] = item.name
+                    continue
+                
+                scanned_count += 1
+                if item.name.endswith(audio_suffixes):
+                    record_audio_file(item.name, audio_files)
+            
+            logger.info(f"Listing {len(shard_futures)} folders in parallel...")
+            for future in as_completed(shard_futures):
+                matches, shard_scanned = future.result()
+                audio_files.extend(matches)
+                scanned_count += shard_scanned
+                logger.info(f"Finished '{shard_futures[future]}': {shard_scanned:,} blobs scanned, {len(matches):,} audio files")
+        
+        if max_files and len(audio_files) >= max_files:
+            audio_files = audio_files[:max_files]
+            logger.info(f"Reached max_files limit ({max_files:,}). Stopped scan early.")
         
         logger.info(f"Scanning complete! Found {len(audio_files):,} audio files (scanned {scanned_count:,} total blobs)")
         return audio_files
@@ -268,91 +414,146 @@ def list_audio_files_from_blob(
         raise
 
 
+def get_container_sas(container_client: ContainerClient) -> Optional[str]:
+    """
+    Return a read-only SAS token for the container, shared by every blob URL.
+    
+    The token is valid for 24 hours and regenerated after 23 hours so long
+    runs never hand out an expired URL.
+    """
+    global _container_sas, _container_sas_refresh_at
+    
+    with _container_sas_lock:
+        if _container_sas is None or time.monotonic() >= _container_sas_refresh_at:
+            # Account key comes from the shared-key credential built from the connection string
+            account_key = getattr(container_client.credential, 'account_key', None)
+            if not account_key:
+                return None
+            
+            _container_sas = generate_container_sas(
+                account_name=container_client.account_name,
+                container_name=container_client.container_name,
+                account_key=account_key,
+                permission=ContainerSasPermissions(read=True),
+                expiry=datetime.utcnow() + timedelta(hours=24)
+            )
+            _container_sas_refresh_at = time.monotonic() + SAS_REFRESH_SECONDS
+        return _container_sas
+
+
 def generate_blob_url(
-    connection_string: str,
-    container_name: str,
-    blob_name: str
+    container_client: ContainerClient,
+    blob_name: str,
+    sas_token: Optional[str] = None
 ) -> str:
     """Generate a URL for a blob that can be accessed externally."""
-    blob_service_client = BlobServiceClient.from_connection_string(connection_string)
-    account_name = blob_service_client.account_name
-    
-    # Parse connection string to get account key
-    conn_parts = dict(part.split('=', 1) for part in connection_string.split(';') if '=' in part)
-    account_key = conn_parts.get('AccountKey', '')
-    
-    if account_key:
-        # Generate SAS token valid for 24 hours
-        sas_token = generate_container_sas(
-            account_name=account_name,
-            container_name=container_name,
-            account_key=account_key,
-            permission=ContainerSasPermissions(read=True),
-            expiry=datetime.utcnow() + timedelta(hours=24)
-        )
-    
-    # Construct blob URL
-    blob_url = f"https://{account_name}.blob.core.windows.net/{container_name}/{blob_name}"
-    
-    # Add SAS token
-    separator = "&" if "?" in blob_url else "?"
-    blob_url = f"{blob_url}{separator}{sas_token}"
-    
+    blob_url = (
+        f"https://{container_client.account_name}.blob.core.windows.net/"
+        f"{container_client.container_name}/{quote(blob_name)}"
+    )
+    if sas_token:
+        blob_url = f"{blob_url}?{sas_token}"
     return blob_url
 
 
 def move_blob_to_archive(
-    connection_string: str,
-    container_name: str,
+    container_client: ContainerClient,
     blob_name: str,
     archive_folder: str = "Archive"
 ) -> Optional[str]:
-    """Move a blob to the Archive folder after successful transcription."""
+    """
+    Move a blob to the Archive folder after successful transcription.
+    
+    The copy is done immediately; deleting the original is queued and sent in
+    batches by flush_archive_deletes().
+    """
     try:
-        blob_service_client = BlobServiceClient.from_connection_string(connection_string)
-        container_client = blob_service_client.get_container_client(container_name)
-        
         # Construct new blob path in Archive folder
         original_name = blob_name.split('/')[-1]  # Get just the filename
         new_blob_path = f"{archive_folder}/{original_name}"
         
-        # Get source blob client
+        # Get source blob client. The name was just listed, so it is not
+        # checked for existence first; a missing source fails the copy below.
         source_blob_client = container_client.get_blob_client(blob_name)
         
-        # Check if source blob exists
-        if not source_blob_client.exists():
-            logger.warning(f"Source blob {blob_name} does not exist, skipping move")
-            return None
-        
         # Get destination blob client
         dest_blob_client = container_client.get_blob_client(new_blob_path)
         
-        # Copy blob to new location
-        dest_blob_client.start_copy_from_url(source_blob_client.url)
-        
-        # Wait for copy to complete
-        copy_props = dest_blob_client.get_blob_properties()
-        max_wait_time = 30  # Maximum wait time in seconds
-        wait_time = 0
-        while copy_props.copy.status == 'pending' and wait_time < max_wait_time:
+        # Copy blob to new location. Same-account copies usually finish within
+        # the request, but the service may still report 'pending'; wait for it
+        # so a late copy is not mistaken for a failure
+        copy_props = dest_blob_client.start_copy_from_url(source_blob_client.url)
+        copy_status = copy_props.get('copy_status')
+        wait_time = 0.0
+        while copy_status == 'pending' and wait_time < ARCHIVE_COPY_MAX_WAIT_SECONDS:
             time.sleep(0.5)
             wait_time += 0.5
-            copy_props = dest_blob_client.get_blob_properties()
-        
-        if copy_props.copy.status == 'success':
+            copy_status = dest_blob_client.get_blob_properties().copy.status
+        if copy_status == 'pending':
+            # Give up on this copy so it can't land later next to the source,
+            # which stays in place and is picked up by the next run
+            try:
+                dest_blob_client.abort_copy(copy_props['copy_id'])
+            except Exception as e:
+                logger.warning(f"Could not abort pending copy of {blob_name}: {e}")
+        
+        if copy_status == 'success':
             # Delete original blob after successful copy
-            source_blob_client.delete_blob()
-            logger.info(f"Moved {blob_name} to {new_blob_path}")
+            queue_archive_delete(container_client, blob_name)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Moved {blob_name} to {new_blob_path}")
             return new_blob_path
         else:
-            logger.error(f"Failed to copy blob: {copy_props.copy.status}")
+            logger.error(f"Failed to copy blob: {copy_status}")
             return None
             
+    except ResourceNotFoundError:
+        logger.warning(f"Source blob {blob_name} does not exist, skipping move")
+        return None
     except Exception as e:
         logger.error(f"Error moving blob {blob_name} to Archive folder: {e}")
         return None
 
 
+def _delete_blobs_in_batch(container_client, blob_names: List[str]):
+    """Delete up to ARCHIVE_DELETE_BATCH_SIZE blobs with a single Blob Batch request."""
+    try:
+        responses = container_client.delete_blobs(*blob_names, raise_on_any_failure=False)
+        failures = [
+            name for name, response in zip(blob_names, responses)
+            if response.status_code not in (202, 404)
+        ]
+        if failures:
+            logger.error(f"Failed to delete {len(failures)} archived source blobs: {failures}")
+        else:
+            logger.info(f"Deleted {len(blob_names)} archived source blobs")
+    except Exception as e:
+        logger.error(f"Error deleting {len(blob_names)} archived source blobs: {e}")
+
+
+def queue_archive_delete(container_client, blob_name: str):
+    """Queue an archived source blob for deletion, sending a batch once it is full."""
+    batch = None
+    with _pending_deletes_lock:
+        _pending_deletes.append(blob_name)
+        if len(_pending_deletes) >= ARCHIVE_DELETE_BATCH_SIZE:
+            batch = _pending_deletes[:]
+            _pending_deletes.clear()
+    
+    if batch:
+        _delete_blobs_in_batch(container_client, batch)
+
+
+def flush_archive_deletes(container_client):
+    """Delete any archived source blobs still waiting in the queue."""
+    with _pending_deletes_lock:
+        pending = _pending_deletes[:]
+        _pending_deletes.clear()
+    
+    for start in range(0, len(pending), ARCHIVE_DELETE_BATCH_SIZE):
+        _delete_blobs_in_batch(container_client, pending[start:start + ARCHIVE_DELETE_BATCH_SIZE])
+
+
 # ============================================================================
 # MAIN PROCESSING FUNCTION
 # ============================================================================
@@ -360,8 +561,7 @@ def move_blob_to_archive(
 def process_audio_file(
     audio_file: Dict[str, Any],
     workflow: SimpleTranscriptionWorkflow,
-    connection_string: str,
-    container_name: str,
+    container_client: ContainerClient,
     idx: int,
     total: int
 ) -> Dict[str, Any]:
@@ -378,11 +578,16 @@ def process_audio_file(
         result["error"] = "Missing audiopath"
         return result
     
+    # Per-file info logs are only emitted for every 100th file; failures are
+    # always logged
+    log_this_file = idx % 100 == 0 and logger.isEnabledFor(logging.INFO)
+    
     try:
-        logger.info(f"[{idx}/{total}] Processing: {audio_path}")
+        if log_this_file:
+            logger.info(f"[{idx}/{total}] Processing: {audio_path}")
         
         # Generate blob URL
-        audio_url = generate_blob_url(connection_string, container_name, audio_path)
+        audio_url = generate_blob_url(container_client, audio_path, get_container_sas(container_client))
         
         # Wait for rate limit before submitting
         wait_for_rate_limit()
@@ -422,13 +627,12 @@ def process_audio_file(
         result["success"] = True
         
         # Move file to Archive after successful transcription
-        archive_path = move_blob_to_archive(connection_string, container_name, audio_path)
-        if archive_path:
-            logger.info(f"Successfully moved {audio_path} to Archive")
-        else:
+        archive_path = move_blob_to_archive(container_client, audio_path)
+        if not archive_path:
             logger.warning(f"Failed to move {audio_path} to Archive (transcript saved anyway)")
         
-        logger.info(f"[SUCCESS] Completed {idx}/{total}: {audio_path}")
+        if log_this_file:
+            logger.info(f"[SUCCESS] Completed {idx}/{total}: {audio_path}")
         return result
         
     except Exception as e:
@@ -452,11 +656,20 @@ def main():
         logger.error("Please set VOICEGAIN_TOKEN in the script configuration")
         sys.exit(1)
     
+    # Create transcription workflow; its blob client is shared by all helpers
+    workflow = SimpleTranscriptionWorkflow(
+        voicegain_bearer_token=VOICEGAIN_TOKEN,
+        blob_connection_string=BLOB_CONNECTION_STRING,
+        blob_container_name=CONTAINER_NAME,
+        output_folder="Transcripts",
+        http_session=create_http_session()
+    )
+    container_client = workflow.container_client
+    
     # List audio files
     logger.info("Listing audio files from blob storage...")
     audio_files = list_audio_files_from_blob(
-        BLOB_CONNECTION_STRING,
-        CONTAINER_NAME,
+        container_client,
         max_files=MAX_FILES
     )
     
@@ -467,45 +680,57 @@ def main():
     total_files = len(audio_files)
     logger.info(f"Found {total_files:,} audio files to process")
     
-    # Create transcription workflow
-    workflow = SimpleTranscriptionWorkflow(
-        voicegain_bearer_token=VOICEGAIN_TOKEN,
-        blob_connection_string=BLOB_CONNECTION_STRING,
-        blob_container_name=CONTAINER_NAME,
-        output_folder="Transcripts"
-    )
-    
     # Process files
     logger.info("Starting transcription processing...")
-    logger.info(f"Rate limit: {MAX_FILES_PER_HOUR} files per hour (~{MIN_DELAY_BETWEEN_SUBMISSIONS:.2f}s between submissions)")
+    logger.info(f"Rate limit: {MAX_FILES_PER_HOUR} files per hour (bursts of up to {RATE_LIMIT_BURST} submissions)")
     
     successful = 0
     failed = 0
+    completed = 0
     
     start_time = time.time()
     
-    for idx, audio_file in enumerate(audio_files, 1):
-        result = process_audio_file(
-            audio_file,
-            workflow,
-            BLOB_CONNECTION_STRING,
-            CONTAINER_NAME,
-            idx,
-            total_files
-        )
-        
-        if result["success"]:
-            successful += 1
-        else:
-            failed += 1
-        
-        # Log progress every 10 files
-        if idx % 10 == 0:
-            elapsed = time.time() - start_time
-            rate = idx / elapsed if elapsed > 0 else 0
-            remaining = (total_files - idx) / rate if rate > 0 else 0
-            logger.info(f"Progress: {idx}/{total_files} ({successful} successful, {failed} failed) | "
-                       f"Rate: {rate:.2f} files/sec | ETA: {remaining/60:.1f} minutes")
+    # Files are processed concurrently; the shared rate limiter still spaces
+    # out VoiceGain submissions so the hourly cap is respected.
+    logger.info(f"Processing with {MAX_WORKERS} concurrent workers")
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            future_to_file = {
+                executor.submit(
+                    process_audio_file,
+                    audio_file,
+                    workflow,
+                    container_client,
+                    idx,
+                    total_files
+                ): audio_file
+                for idx, audio_file in enumerate(audio_files, 1)
+            }
+            
+            for future in as_completed(future_to_file):
+                audio_file = future_to_file[future]
+                completed += 1
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.exception(f"Unexpected error processing {audio_file.get('audiopath')}: {e}")
+                    result = {"success": False}
+                
+                if result["success"]:
+                    successful += 1
+                else:
+                    failed += 1
+                
+                # Log progress every 10 files
+                if completed % 10 == 0:
+                    elapsed = time.time() - start_time
+                    rate = completed / elapsed if elapsed > 0 else 0
+                    remaining = (total_files - completed) / rate if rate > 0 else 0
+                    logger.info(f"Progress: {completed}/{total_files} ({successful} successful, {failed} failed) | "
+                               f"Rate: {rate:.2f} files/sec | ETA: {remaining/60:.1f} minutes")
+    finally:
+        # Delete any archived source blobs left in a partial batch
+        flush_archive_deletes(container_client)
     
     # Summary
     elapsed_time = time.time() - start_time
@@ -5,22 +5,169 @@ container (via Blob/SFTP endpoint) or a local directory, and schedules
 each transcription as a separate activity function.
 """
 
+import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from itertools import groupby
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import azure.durable_functions as df  # type: ignore[import]
 import azure.functions as func  # type: ignore[import]
 import requests
-from azure.storage.blob import BlobServiceClient
+from azure.core.exceptions import ResourceNotFoundError
+from azure.storage.blob import BlobServiceClient, ContentSettings
+from requests.adapters import HTTPAdapter
+
+# orjson parses large transcript bodies and metadata manifests several times
+# faster than the stdlib; fall back to json if it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Both accept bytes, and orjson.JSONDecodeError subclasses json.JSONDecodeError
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 # Configure module-level logger for Azure Functions
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Items handed to each ProcessTranscriptionBatch activity. Batching cuts
+# orchestration history and queue traffic by this factor.
+TRANSCRIPTION_BATCH_SIZE = 16
+
+# Must match durableTask.maxConcurrentActivityFunctions in host.json. Any of
+# these slots may be running a ProcessTranscriptionBatch at the same time.
+MAX_CONCURRENT_ACTIVITIES = 8
+
+# Each transcription spends minutes waiting on VoiceGain (submit, then
+# polling), so activities hand the blocking work to a dedicated I/O pool and
+# await it. This keeps the worker's event loop free to start further
+# activities instead of tying one worker thread up per audio file. The pool
+# holds every item of every concurrent batch, so no item waits for a thread
+# while its activity's clock (functionTimeout in host.json) is running.
+MAX_CONCURRENT_TRANSCRIPTIONS = MAX_CONCURRENT_ACTIVITIES * TRANSCRIPTION_BATCH_SIZE
+
+# Per-day, per-source checkpoint of audio paths already transcribed, so
+# re-running an orchestration skips finished (and already paid for) items.
+# Every finished batch writes only its own paths to a blob under this prefix;
+# loading merges them
+PROCESSED_ITEMS_PREFIX = "autoqa/processedItems/{day}/{source}/"
+CHECKPOINT_DOWNLOAD_WORKERS = 16
+_transcription_executor = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_TRANSCRIPTIONS,
+    thread_name_prefix="transcription",
+)
+
+# Metadata blobs are each a separate download, so they are fetched in
+# parallel rather than one round-trip at a time
+METADATA_DOWNLOAD_WORKERS = 32
+
+
+# Submission settings shared by every request; only the audio URL varies
+_BASE_PAYLOAD: Dict[str, Any] = {
+    "modelName": "VoiceGain-Omega:2",
+    "settings": {
+        "asr": {
+            "diarization": {
+                "maxSpeakers": 3,
+                "minSpeakers": 2,
+            }
+        },
+        "formatters": [
+            {"type": "digits"},
+            {"parameters": {"enabled": "true"}, "type": "basic"},
+            {"parameters": {"CC": True, "EMAIL": "true"}, "type": "enhanced"},
+            {"parameters": {"mask": "partial"}, "type": "profanity"},
+            {"parameters": {"lang": "en-US"}, "type": "spelling"},
+            {
+                "parameters": {
+                    "ADDRESS": "full",
+                    "CARDINAL": "full",
+                    "CC": "full",
+                    "DATE": "full",
+                    "EMAIL": "full",
+                    "EVENT": "full",
+                    "FAC": "full",
+                    "GPE": "full",
+                    "LANGUAGE": "full",
+                    "LAW": "full",
+                    "NORP": "full",
+                    "MONEY": "full",
+                    "ORDINAL": "full",
+                    "ORG": "full",
+                    "PERCENT": "full",
+                    "PERSON": "full",
+                    "PHONE": "full",
+                    "PRODUCT": "full",
+                    "QUANTITY": "full",
+                    "SSN": "full",
+                    "TIME": "full",
+                    "WORK_OF_ART": "full",
+                    "ZIP": "full",
+                },
+                "type": "redact",
+            },
+            {
+                "parameters": {
+                    "mask": "full",
+                    "options": "IA",
+                    "pattern": "[1-9][0-9]{3}[ ]?[a-zA-Z]{2}",
+                },
+                "type": "regex",
+            },
+            {
+                "parameters": {
+                    "mask": "full",
+                    "options": "IA",
+                    "pattern": "\\d+\\.",
+                },
+                "type": "regex",
+            },
+        ],
+        "preemptible": False,
+    },
+    "sessions": [
+        {
+            "asyncMode": "OFF-LINE",
+            "poll": {"persist": 600000},
+            "content": {
+                "incremental": ["progress"],
+                "full": ["transcript", "words"],
+            },
+        }
+    ],
+}
+
+
+# Path separators flattened when turning an audio path into a transcript name
+_SANITIZE = str.maketrans({"/": "_", "\\": "_"})
+
+# Audio extensions replaced by .txt in transcript names
+_AUDIO_FILE_EXTENSIONS = frozenset({".mp3", ".wav", ".m4a"})
+
+# Transcripts are uploaded as UTF-8 text; built once and shared by all uploads
+_TRANSCRIPT_CONTENT_SETTINGS = ContentSettings(content_type="text/plain; charset=utf-8")
+
+# Longest Retry-After a 429 on submission is waited out for before the item is
+# reported as rate limited
+MAX_SUBMIT_RETRY_AFTER_SECONDS = 60
+
+
+def _retry_after_seconds(response: requests.Response, default: float) -> float:
+    """Return the Retry-After delay of a response, or default if absent."""
+    try:
+        return max(float(response.headers.get("Retry-After")), 0.0)
+    except (TypeError, ValueError):
+        # Missing, or given as an HTTP date
+        return default
+
 
 class TranscriptionWorkflow:
     """Encapsulates the transcription process for a single audio asset."""
@@ -32,8 +179,12 @@ class TranscriptionWorkflow:
         azure_function_url: Optional[str] = None,
         audio_base_url: Optional[str] = None,
         blob_container_name: str = "autoqa",
+        http_session: Optional[requests.Session] = None,
     ) -> None:
         self.voicegain_token = voicegain_bearer_token
+        # Keep-alive session so submit, every poll and the transcript download
+        # reuse connections; callers running many workflows can share one.
+        self.http_session = http_session or self._create_http_session()
         self.azure_function_url = azure_function_url
         self.audio_base_url = audio_base_url.rstrip("/") if audio_base_url else None
         self.blob_service_client = (
@@ -42,12 +193,32 @@ class TranscriptionWorkflow:
             else None
         )
         self.blob_container_name = blob_container_name
+        self.container_client = (
+            self.blob_service_client.get_container_client(blob_container_name)
+            if self.blob_service_client
+            else None
+        )
 
         # Runtime variables populated during execution
-        self.session_url: Optional[str] = None
         self.results_phase: str = ""
         self.status: str = ""
 
+        # (date, blob prefix) for today's transcript folder, stored as one
+        # tuple so concurrent saves never see a mismatched pair
+        self._transcript_folder: Tuple[Optional[date], str] = (None, "")
+
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        # Cached workflows are shared by concurrent activities, so the pool is
+        # sized for every one of them to hold a connection
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=MAX_CONCURRENT_TRANSCRIPTIONS,
+        )
+        session.mount("https://", adapter)
+        return session
+
     @staticmethod
     def _ensure_iterable(value: Any) -> Iterable[Dict[str, Any]]:
         if isinstance(value, list):
@@ -56,6 +227,20 @@ class TranscriptionWorkflow:
             return [value]
         return []
 
+    @staticmethod
+    def _iter_files(root: str) -> Iterable[os.DirEntry]:
+        """Yield file entries under root, using scandir's cached type info."""
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from TranscriptionWorkflow._iter_files(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError as exc:
+            # Match os.walk, which silently skips unreadable directories
+            logger.debug("Skipping unreadable directory %s: %s", root, exc)
+
     def list_audio_items_from_directory(
         self,
         target_directory: str,
@@ -76,51 +261,64 @@ class TranscriptionWorkflow:
         """
         metadata_extensions = metadata_extensions or [".json"]
         audio_extensions = audio_extensions or [".wav", ".mp3", ".m4a"]
-
-        discovered: Dict[str, Dict[str, Any]] = {}
+        # str.endswith accepts a tuple, so each name is checked in one call
+        meta_exts = tuple(ext.lower() for ext in metadata_extensions)
+        audio_exts = tuple(ext.lower() for ext in audio_extensions)
+
+        # Records in discovery order, plus each key's position so metadata can
+        # replace an entry in place
+        records: List[Dict[str, Any]] = []
+        record_index: Dict[str, int] = {}
         logger.info("Scanning directory %s for transcription work items", target_directory)
 
-        for root, _, files in os.walk(target_directory):
-            for filename in files:
-                file_path = os.path.join(root, filename)
-                lower_name = filename.lower()
-
-                if any(lower_name.endswith(ext) for ext in metadata_extensions):
-                    try:
-                        with open(file_path, "r", encoding="utf-8") as handle:
-                            payload = json.load(handle)
-                    except (json.JSONDecodeError, OSError) as exc:
-                        logger.warning(
-                            "Skipping metadata file %s due to error: %s",
-                            file_path,
-                            exc,
-                        )
-                        continue
+        # scandir paths are built by joining onto target_directory, so the
+        # relative key is a plain slice instead of an os.path.relpath call
+        root_prefix_len = len(os.path.join(target_directory, ""))
 
-                    for record in self._ensure_iterable(payload):
-                        if not isinstance(record, dict):
-                            continue
-                        audio_path = record.get("audiopath")
-                        if not audio_path:
-                            continue
-                        key = audio_path.replace("\\", "/")
-                        discovered[key] = {
-                            **record,
-                            "audiopath": key,
-                            "source_metadata": file_path,
-                        }
+        for entry in self._iter_files(target_directory):
+            file_path = entry.path
+            lower_name = entry.name.lower()
 
-                elif any(lower_name.endswith(ext) for ext in audio_extensions):
-                    key = os.path.relpath(file_path, target_directory).replace("\\", "/")
-                    discovered.setdefault(
-                        key,
+            if lower_name.endswith(meta_exts):
+                try:
+                    with open(file_path, "rb") as handle:
+                        payload = _json_loads(handle.read())
+                except (json.JSONDecodeError, OSError) as exc:
+                    logger.warning(
+                        "Skipping metadata file %s due to error: %s",
+                        file_path,
+                        exc,
+                    )
+                    continue
+
+                for record in self._ensure_iterable(payload):
+                    if not isinstance(record, dict):
+                        continue
+                    audio_path = record.get("audiopath")
+                    if not audio_path:
+                        continue
+                    key = audio_path.replace("\\", "/")
+                    # Records are freshly parsed, so annotate them in place
+                    record["audiopath"] = key
+                    record["source_metadata"] = file_path
+                    position = record_index.get(key)
+                    if position is None:
+                        record_index[key] = len(records)
+                        records.append(record)
+                    else:
+                        records[position] = record
+
+            elif lower_name.endswith(audio_exts):
+                key = file_path[root_prefix_len:].replace("\\", "/")
+                if key not in record_index:
+                    record_index[key] = len(records)
+                    records.append(
                         {
                             "audiopath": key,
                             "source_metadata": None,
-                        },
+                        }
                     )
 
-        records = list(discovered.values())
         logger.info("Discovered %d audio items to process", len(records))
         return records
 
@@ -147,6 +345,9 @@ class TranscriptionWorkflow:
         """
         metadata_extensions = metadata_extensions or [".json"]
         audio_extensions = audio_extensions or [".wav", ".mp3", ".m4a"]
+        # str.endswith accepts a tuple, so each name is checked in one call
+        meta_exts = tuple(ext.lower() for ext in metadata_extensions)
+        audio_exts = tuple(ext.lower() for ext in audio_extensions)
 
         service_client = BlobServiceClient.from_connection_string(connection_string)
         container_client = service_client.get_container_client(container_name)
@@ -155,32 +356,54 @@ class TranscriptionWorkflow:
         if prefix and not prefix.endswith("/"):
             prefix = f"{prefix}/"
 
-        discovered: Dict[str, Dict[str, Any]] = {}
+        # Records in discovery order, plus each key's position so metadata can
+        # replace an entry in place
+        records: List[Dict[str, Any]] = []
+        record_index: Dict[str, int] = {}
         logger.info(
             "Scanning storage container %s (prefix=%s) for transcription items",
             container_name,
             prefix,
         )
 
-        for blob in container_client.list_blobs(name_starts_with=prefix):
-            blob_name = blob.name
+        # Collect candidate names first; metadata is downloaded afterwards
+        candidate_names: List[str] = []
+        metadata_names: List[str] = []
+
+        # Only names are needed, so skip deserializing full blob properties
+        for blob_name in container_client.list_blob_names(
+            name_starts_with=prefix,
+            results_per_page=5000,
+        ):
             lower_name = blob_name.lower()
-            rel_name = blob_name[len(prefix) :] if blob_name.startswith(prefix) else blob_name
 
-            if any(lower_name.endswith(ext) for ext in metadata_extensions):
-                try:
-                    blob_data = container_client.download_blob(blob_name).content_as_text(
-                        encoding="utf-8"
-                    )
-                    payload = json.loads(blob_data)
-                except (json.JSONDecodeError, OSError) as exc:
-                    logger.warning(
-                        "Skipping metadata blob %s due to error: %s",
-                        blob_name,
-                        exc,
-                    )
-                    continue
+            if lower_name.endswith(meta_exts):
+                metadata_names.append(blob_name)
+                candidate_names.append(blob_name)
+            elif lower_name.endswith(audio_exts):
+                candidate_names.append(blob_name)
+
+        def fetch_metadata(blob_name: str) -> Any:
+            try:
+                blob_data = container_client.download_blob(blob_name).readall()
+                return _json_loads(blob_data)
+            except (json.JSONDecodeError, OSError) as exc:
+                logger.warning(
+                    "Skipping metadata blob %s due to error: %s",
+                    blob_name,
+                    exc,
+                )
+                return None
+
+        with ThreadPoolExecutor(max_workers=METADATA_DOWNLOAD_WORKERS) as executor:
+            metadata_payloads = dict(
+                zip(metadata_names, executor.map(fetch_metadata, metadata_names))
+            )
 
+        # Merge in listing order so metadata overrides behave as before
+        for blob_name in candidate_names:
+            if blob_name in metadata_payloads:
+                payload = metadata_payloads[blob_name]
                 for record in self._ensure_iterable(payload):
                     if not isinstance(record, dict):
                         continue
@@ -188,24 +411,28 @@ class TranscriptionWorkflow:
                     if not audio_path:
                         continue
                     key = audio_path.replace("\\", "/")
-                    discovered[key] = {
-                        **record,
-                        "audiopath": key,
-                        "source_metadata": blob_name,
-                    }
+                    # Records are freshly parsed, so annotate them in place
+                    record["audiopath"] = key
+                    record["source_metadata"] = blob_name
+                    position = record_index.get(key)
+                    if position is None:
+                        record_index[key] = len(records)
+                        records.append(record)
+                    else:
+                        records[position] = record
 
-            elif any(lower_name.endswith(ext) for ext in audio_extensions):
+            else:
                 # Use the full blob_name (with directory) as the key
                 key = blob_name.replace("\\", "/")
-                discovered.setdefault(
-                    key,
-                    {
-                        "audiopath": key,
-                        "source_metadata": None,
-                    },
-                )
+                if key not in record_index:
+                    record_index[key] = len(records)
+                    records.append(
+                        {
+                            "audiopath": key,
+                            "source_metadata": None,
+                        }
+                    )
 
-        records = list(discovered.values())
         logger.info("Discovered %d audio items in container %s", len(records), container_name)
         return records
 
@@ -217,90 +444,43 @@ class TranscriptionWorkflow:
         }
 
         payload = {
-            "modelName": "VoiceGain-Omega:2",
-            "audio": {"source": {"fromUrl": {"url": audio_url}}},  # type: ignore[dict-item]
-            "settings": {
-                "asr": {
-                    "diarization": {
-                        "maxSpeakers": 3,
-                        "minSpeakers": 2,
-                    }
-                },
-                "formatters": [
-                    {"type": "digits"},
-                    {"parameters": {"enabled": "true"}, "type": "basic"},
-                    {"parameters": {"CC": True, "EMAIL": "true"}, "type": "enhanced"},
-                    {"parameters": {"mask": "partial"}, "type": "profanity"},
-                    {"parameters": {"lang": "en-US"}, "type": "spelling"},
-                    {
-                        "parameters": {
-                            "ADDRESS": "full",
-                            "CARDINAL": "full",
-                            "CC": "full",
-                            "DATE": "full",
-                            "EMAIL": "full",
-                            "EVENT": "full",
-                            "FAC": "full",
-                            "GPE": "full",
-                            "LANGUAGE": "full",
-                            "LAW": "full",
-                            "NORP": "full",
-                            "MONEY": "full",
-                            "ORDINAL": "full",
-                            "ORG": "full",
-                            "PERCENT": "full",
-                            "PERSON": "full",
-                            "PHONE": "full",
-                            "PRODUCT": "full",
-                            "QUANTITY": "full",
-                            "SSN": "full",
-                            "TIME": "full",
-                            "WORK_OF_ART": "full",
-                            "ZIP": "full",
-                        },
-                        "type": "redact",
-                    },
-                    {
-                        "parameters": {
-                            "mask": "full",
-                            "options": "IA",
-                            "pattern": "[1-9][0-9]{3}[ ]?[a-zA-Z]{2}",
-                        },
-                        "type": "regex",
-                    },
-                    {
-                        "parameters": {
-                            "mask": "full",
-                            "options": "IA",
-                            "pattern": "\\d+\\.",
-                        },
-                        "type": "regex",
-                    },
-                ],
-                "preemptible": False,
-            },
-            "sessions": [
-                {
-                    "asyncMode": "OFF-LINE",
-                    "poll": {"persist": 600000},
-                    "content": {
-                        "incremental": ["progress"],
-                        "full": ["transcript", "words"],
-                    },
-                }
-            ],
+            **_BASE_PAYLOAD,
+            "audio": {"source": {"fromUrl": {"url": audio_url}}},
         }
+        body = (
+            orjson.dumps(payload)
+            if orjson is not None
+            else json.dumps(payload).encode("utf-8")
+        )
 
-        response = requests.post(
+        response = self.http_session.post(
             "https://api.voicegain.ai/v1/asr/transcribe/async",
             headers=headers,
-            json=payload,
+            data=body,
             timeout=30,
         )
 
         if response.status_code == 429:
-            logger.warning("Rate limited by VoiceGain while submitting %s", audio_url)
-            return None
+            # Honor a short server-provided Retry-After once before giving up
+            retry_after = _retry_after_seconds(response, default=-1.0)
+            if not 0 <= retry_after <= MAX_SUBMIT_RETRY_AFTER_SECONDS:
+                logger.warning("Rate limited by VoiceGain while submitting %s", audio_url)
+                return None
+            logger.warning(
+                "Rate limited by VoiceGain while submitting %s. Retrying in %.1fs...",
+                audio_url,
+                retry_after,
+            )
+            time.sleep(retry_after)
+            response = self.http_session.post(
+                "https://api.voicegain.ai/v1/asr/transcribe/async",
+                headers=headers,
+                data=body,
+                timeout=30,
+            )
+            if response.status_code == 429:
+                logger.warning("Rate limited by VoiceGain while submitting %s", audio_url)
+                return None
 
         response.raise_for_status()
         return response.json()
@@ -310,20 +490,43 @@ class TranscriptionWorkflow:
         session_url: str,
         max_iterations: int = 60,
         delay_seconds: int = 20,
+        initial_delay_seconds: float = 2.0,
+        backoff_factor: float = 1.5,
     ) -> Tuple[str, str]:
+        """
+        Poll a VoiceGain session until it finishes.
+
+        The first poll happens after initial_delay_seconds, and the delay then
+        grows by backoff_factor up to delay_seconds, dropping back to the
+        initial delay whenever the phase changes. Short jobs are therefore
+        picked up within seconds. The total wait is capped at
+        max_iterations * delay_seconds, the same budget as polling at a fixed
+        delay_seconds.
+        """
         headers = {"Authorization": f"Bearer {self.voicegain_token}"}
 
         results = ""
         status = ""
         iteration_count = 0
-
-        while results != "DONE" and iteration_count < max_iterations:
-            time.sleep(delay_seconds)
-
-            response = requests.get(session_url, headers=headers, timeout=30)
+        delay = initial_delay_seconds
+        last_phase = None
+        deadline = time.monotonic() + max_iterations * delay_seconds
+
+        while results != "DONE" and time.monotonic() < deadline:
+            time.sleep(delay)
+
+            response = self.http_session.get(session_url, headers=headers, timeout=30)
+            if response.status_code == 429:
+                delay = max(delay, _retry_after_seconds(response, default=delay_seconds))
+                logger.warning(
+                    "Rate limited while polling session %s. Retrying in %.1fs...",
+                    session_url,
+                    delay,
+                )
+                continue
             response.raise_for_status()
 
-            data = response.json()
+            data = _json_loads(response.content)
             phase = data.get("progress", {}).get("phase", "")
             results = phase
 
@@ -332,16 +535,21 @@ class TranscriptionWorkflow:
                 status = "fail"
                 break
 
+            if phase != last_phase:
+                delay = initial_delay_seconds
+                last_phase = phase
+            else:
+                delay = min(delay * backoff_factor, delay_seconds)
+
             iteration_count += 1
             logger.info(
-                "Polling session %s iteration %d/%d phase=%s",
+                "Polling session %s iteration %d phase=%s",
                 session_url,
                 iteration_count,
-                max_iterations,
                 phase,
             )
 
-        if iteration_count >= max_iterations and results != "DONE":
+        if results != "DONE":
             status = "timeout"
             results = "DONE"
             logger.error("Polling timeout reached for session %s", session_url)
@@ -351,9 +559,9 @@ class TranscriptionWorkflow:
     def get_transcript(self, session_url: str) -> Dict[str, Any]:
         headers = {"Authorization": f"Bearer {self.voicegain_token}"}
         transcript_url = f"{session_url}/transcript"
-        response = requests.get(transcript_url, headers=headers, timeout=30)
+        response = self.http_session.get(transcript_url, headers=headers, timeout=30)
         response.raise_for_status()
-        transcript_data = response.json()
+        transcript_data = _json_loads(response.content)
         
         # Handle case where transcript is returned as a list (array of segments)
         if isinstance(transcript_data, list):
@@ -377,21 +585,21 @@ class TranscriptionWorkflow:
                 logger.warning("Transcript data is an empty list")
                 return {}
         
-        # Log transcript data structure for debugging
-        if isinstance(transcript_data, dict):
+        if not isinstance(transcript_data, dict):
+            logger.warning(f"Unexpected transcript data type: {type(transcript_data)}")
+        elif logger.isEnabledFor(logging.DEBUG):
+            # Log transcript data structure for debugging
             logger.debug(f"Transcript data keys: {list(transcript_data.keys())}")
             if "utterances" in transcript_data:
                 logger.debug(f"Utterances count: {len(transcript_data.get('utterances', []))}")
             if "words" in transcript_data:
                 logger.debug(f"Words count: {len(transcript_data.get('words', []))}")
-        else:
-            logger.warning(f"Unexpected transcript data type: {type(transcript_data)}")
         
         return transcript_data if isinstance(transcript_data, dict) else {}
 
     def format_transcript(self, transcript_data: Dict[str, Any]) -> str:
         if self.azure_function_url:
-            response = requests.post(
+            response = self.http_session.post(
                 self.azure_function_url,
                 json=transcript_data,
                 timeout=30,
@@ -407,22 +615,20 @@ class TranscriptionWorkflow:
 
     def _format_transcript_locally(self, transcript_data: Dict[str, Any]) -> str:
         formatted_lines: List[str] = []
+        utterances = transcript_data.get("utterances")
+        words = transcript_data.get("words")
 
         # Check for utterances first (preferred format)
-        if "utterances" in transcript_data and transcript_data["utterances"]:
-            for utterance in transcript_data["utterances"]:
-                speaker = utterance.get("speakerId", "Unknown")
-                text = utterance.get("transcript", "")
-                start_time = utterance.get("start", 0) / 1000
-                if text:  # Only add non-empty transcripts
-                    formatted_lines.append(f"[{start_time:.2f}s] Speaker {speaker}: {text}")
+        if utterances:
+            # Only add non-empty transcripts
+            formatted_lines = [
+                f"[{utterance.get('start', 0) / 1000:.2f}s] Speaker {utterance.get('speakerId', 'Unknown')}: {text}"
+                for utterance in utterances
+                if (text := utterance.get("transcript", ""))
+            ]
         # Check for words (alternative format)
         # VoiceGain uses "utterance" and "spk" instead of "text" and "speakerId"
-        elif "words" in transcript_data and transcript_data["words"]:
-            current_speaker = None
-            current_text: List[str] = []
-            segment_start_time = None
-            segment_end_time = None
+        elif words:
 
             def format_timestamp(ms: int) -> str:
                 """Convert milliseconds to HH:MM:SS format"""
@@ -432,45 +638,30 @@ class TranscriptionWorkflow:
                 seconds = total_seconds % 60
                 return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
-            for word in transcript_data["words"]:
-                # VoiceGain uses "spk" for speaker ID
-                speaker = word.get("spk") or word.get("speakerId")
-                # VoiceGain uses "utterance" for the word text
-                word_text = word.get("utterance") or word.get("text", "")
-                if word_text:
-                    word_text = word_text.strip()
-                if not word_text:  # Skip empty words
+            # Drop empty words up front so they never split a speaker segment
+            spoken = [
+                (word, word_text)
+                for word in words
+                if (word_text := (word.get("utterance") or word.get("text", "") or "").strip())
+            ]
+
+            # VoiceGain uses "spk" for speaker ID; consecutive words from the
+            # same speaker form one segment
+            segments = groupby(spoken, key=lambda pair: pair[0].get("spk") or pair[0].get("speakerId"))
+            for index, (speaker, group) in enumerate(segments):
+                segment = list(group)
+                # Words before the first speaker label are not attributed
+                if index == 0 and speaker is None:
                     continue
-                
-                # Get word timing
-                word_start = word.get("start", 0)
-                word_duration = word.get("duration", 0)
-                word_end = word_start + word_duration
-                    
-                if speaker != current_speaker:
-                    # Save previous speaker segment with timestamps
-                    if current_text and segment_start_time is not None:
-                        start_time_str = format_timestamp(segment_start_time)
-                        end_time_str = format_timestamp(segment_end_time) if segment_end_time else format_timestamp(segment_start_time)
-                        formatted_lines.append(
-                            f"Speaker {current_speaker} [Starttime - {start_time_str}; Endtime - {end_time_str}]: {' '.join(current_text)}"
-                        )
-                    # Start new speaker segment
-                    current_speaker = speaker
-                    current_text = [word_text]
-                    segment_start_time = word_start
-                    segment_end_time = word_end
-                else:
-                    current_text.append(word_text)
-                    # Update end time to the latest word's end time
-                    segment_end_time = word_end
-
-            # Save last speaker segment with timestamps
-            if current_text and segment_start_time is not None:
+                first_word = segment[0][0]
+                last_word = segment[-1][0]
+                segment_start_time = first_word.get("start", 0)
+                segment_end_time = last_word.get("start", 0) + last_word.get("duration", 0)
                 start_time_str = format_timestamp(segment_start_time)
-                end_time_str = format_timestamp(segment_end_time) if segment_end_time else format_timestamp(segment_start_time)
+                end_time_str = format_timestamp(segment_end_time or segment_start_time)
+                text = " ".join(word_text for _, word_text in segment)
                 formatted_lines.append(
-                    f"Speaker {current_speaker} [Starttime - {start_time_str}; Endtime - {end_time_str}]: {' '.join(current_text)}"
+                    f"Speaker {speaker} [Starttime - {start_time_str}; Endtime - {end_time_str}]: {text}"
                 )
         else:
             # No transcript data found
@@ -492,20 +683,30 @@ class TranscriptionWorkflow:
             )
             return None
 
-        sanitized_name = ""
-        if ".mp3" in audio_identifier:
-            sanitized_name = audio_identifier.replace("/", "_").replace("\\", "_").replace(".mp3", ".txt")
-        elif ".wav" in audio_identifier:
-            sanitized_name = audio_identifier.replace("/", "_").replace("\\", "_").replace(".wav", ".txt")
-
-        today = datetime.utcnow().strftime("%Y-%m-%d")
-        full_blob_path = f"autoqa/transcriptFiles/{today}/{sanitized_name}"
-
-        container_client = self.blob_service_client.get_container_client(
-            self.blob_container_name
+        # Flatten path separators in one pass and swap the audio extension
+        # (in any case, e.g. .MP3) for .txt
+        sanitized_id = audio_identifier.translate(_SANITIZE)
+        stem, ext = os.path.splitext(sanitized_id)
+        sanitized_name = (stem if ext.lower() in _AUDIO_FILE_EXTENSIONS else sanitized_id) + ".txt"
+
+        # Workflows are reused across activities, so the folder is only
+        # re-rendered when the UTC date rolls over
+        today = datetime.utcnow().date()
+        folder_date, folder_prefix = self._transcript_folder
+        if folder_date != today:
+            folder_prefix = f"autoqa/transcriptFiles/{today:%Y-%m-%d}/"
+            self._transcript_folder = (today, folder_prefix)
+        full_blob_path = folder_prefix + sanitized_name
+
+        blob_client = self.container_client.get_blob_client(full_blob_path)
+        # Long calls produce multi-MB transcripts, which are split into blocks
+        # and uploaded in parallel
+        blob_client.upload_blob(
+            transcript_text.encode("utf-8"),
+            overwrite=True,
+            max_concurrency=4,
+            content_settings=_TRANSCRIPT_CONTENT_SETTINGS,
         )
-        blob_client = container_client.get_blob_client(full_blob_path)
-        blob_client.upload_blob(transcript_text, overwrite=True)
         logger.info("Transcript saved to blob path %s", full_blob_path)
         return full_blob_path
 
@@ -526,6 +727,7 @@ class TranscriptionWorkflow:
             "status": "",
             "transcript_blob_path": None,
             "error": None,
+            "session_url": None,
         }
 
         try:
@@ -545,8 +747,11 @@ class TranscriptionWorkflow:
                 response_payload["status"] = "rate_limited"
                 return response_payload
 
-            self.session_url = transcription_response["sessions"][0]["sessionUrl"]
-            results_phase, status = self.poll_transcription_status(self.session_url)
+            # Workflows are shared between concurrent activities, so the session
+            # URL travels in the payload rather than on self
+            session_url = transcription_response["sessions"][0]["sessionUrl"]
+            response_payload["session_url"] = session_url
+            results_phase, status = self.poll_transcription_status(session_url)
             response_payload["status"] = status or results_phase
 
             if status in {"fail", "timeout"}:
@@ -557,7 +762,7 @@ class TranscriptionWorkflow:
                 )
                 return response_payload
 
-            transcript_data = self.get_transcript(self.session_url)
+            transcript_data = self.get_transcript(session_url)
             formatted_transcript = self.format_transcript(transcript_data)
             blob_path = self.save_transcript_to_blob(
                 formatted_transcript,
@@ -582,17 +787,36 @@ app = df.DFApp(http_auth_level=func.AuthLevel.ANONYMOUS)
 
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_workflow(
+    voicegain_bearer_token: str,
+    blob_connection_string: Optional[str],
+    azure_function_url: Optional[str],
+    audio_base_url: Optional[str],
+    blob_container_name: str,
+) -> TranscriptionWorkflow:
+    # Activities of one orchestration share the same settings, so they reuse
+    # one workflow (and its blob client / connection pool) per worker
+    return TranscriptionWorkflow(
+        voicegain_bearer_token=voicegain_bearer_token,
+        blob_connection_string=blob_connection_string,
+        azure_function_url=azure_function_url,
+        audio_base_url=audio_base_url,
+        blob_container_name=blob_container_name,
+    )
+
+
 def _build_workflow(settings: Dict[str, Any]) -> TranscriptionWorkflow:
     required_token = settings.get("voicegain_bearer_token")
     if not required_token:
         raise ValueError("voicegain_bearer_token is required in workflow_settings.")
 
-    return TranscriptionWorkflow(
-        voicegain_bearer_token=required_token,
-        blob_connection_string=settings.get("blob_connection_string"),
-        azure_function_url=settings.get("azure_function_url"),
-        audio_base_url=settings.get("audio_base_url"),
-        blob_container_name=settings.get("blob_container_name", "autoqa"),
+    return _cached_workflow(
+        required_token,
+        settings.get("blob_connection_string"),
+        settings.get("azure_function_url"),
+        settings.get("audio_base_url"),
+        settings.get("blob_container_name", "autoqa"),
     )
 
 
@@ -614,32 +838,66 @@ def transcription_orchestrator(context: df.DurableOrchestrationContext):
         "audio_extensions": audio_extensions,
     }
 
-    audio_items = yield context.call_activity(
-        "ListTranscriptionItems",
-        listing_payload,
-    )
+    checkpoint_payload = {
+        "workflow_settings": workflow_settings,
+        "day": context.current_utc_datetime.strftime("%Y-%m-%d"),
+        "source": _checkpoint_source_key(source_storage, target_directory),
+    }
 
-    task_inputs = [
-        {
-            "item": item,
-            "workflow_settings": workflow_settings,
-            "sas_token": sas_token,
-        }
-        for item in audio_items
-    ]
+    listed_items, processed_paths = yield context.task_all(
+        [
+            context.call_activity("ListTranscriptionItems", listing_payload),
+            context.call_activity("LoadProcessedItems", checkpoint_payload),
+        ]
+    )
+    processed = set(processed_paths)
+    audio_items = [item for item in listed_items if item.get("audiopath") not in processed]
 
     activity_tasks = [
-        context.call_activity("ProcessTranscriptionItem", payload)
-        for payload in task_inputs
+        context.call_activity(
+            "ProcessTranscriptionBatch",
+            {
+                "items": audio_items[start : start + TRANSCRIPTION_BATCH_SIZE],
+                "workflow_settings": workflow_settings,
+                "sas_token": sas_token,
+            },
+        )
+        for start in range(0, len(audio_items), TRANSCRIPTION_BATCH_SIZE)
     ]
 
-    activity_results = yield context.task_all(activity_tasks)
+    # Checkpoint after every finished batch, so a run that is terminated or
+    # fails part-way still records what it already transcribed
+    activity_results = []
+    pending_tasks = list(activity_tasks)
+    while pending_tasks:
+        finished = yield context.task_any(pending_tasks)
+        pending_tasks.remove(finished)
+        batch_results = finished.result
+        activity_results.extend(batch_results)
+
+        # Only this batch's new paths are written, keeping history linear
+        newly_processed = {
+            result["audio_path"]
+            for result in batch_results
+            if result.get("success") and result.get("audio_path")
+        } - processed
+        if newly_processed:
+            processed |= newly_processed
+            yield context.call_activity(
+                "SaveProcessedItems",
+                {
+                    **checkpoint_payload,
+                    "checkpoint_name": f"{context.instance_id}-{activity_tasks.index(finished)}",
+                    "audio_paths": sorted(newly_processed),
+                },
+            )
 
     succeeded = [result for result in activity_results if result.get("success")]
     failed = [result for result in activity_results if not result.get("success")]
 
     return {
         "total": len(activity_results),
+        "skipped": len(listed_items) - len(audio_items),
         "succeeded": len(succeeded),
         "failed": len(failed),
         "failures": failed,
@@ -710,15 +968,113 @@ def ListTranscriptionItems(payload: Dict[str, Any]) -> List[Dict[str, Any]]:  #
 
 
 @app.activity_trigger(input_name="payload")
-def ProcessTranscriptionItem(payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+async def ProcessTranscriptionItem(payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
     workflow_settings = payload.get("workflow_settings") or {}
+    results = await _process_items(
+        [payload.get("item") or {}],
+        workflow_settings,
+        payload.get("sas_token"),
+    )
+    return results[0]
+
+
+@app.activity_trigger(input_name="payload")
+async def ProcessTranscriptionBatch(payload: Dict[str, Any]) -> List[Dict[str, Any]]:  # noqa: N802
+    return await _process_items(
+        [item or {} for item in payload.get("items") or []],
+        payload.get("workflow_settings") or {},
+        payload.get("sas_token"),
+    )
+
+
+async def _process_items(
+    items: List[Dict[str, Any]],
+    workflow_settings: Dict[str, Any],
+    sas_token: Optional[str],
+) -> List[Dict[str, Any]]:
+    """Transcribe items concurrently on the I/O pool, preserving their order."""
     workflow = _build_workflow(workflow_settings)
-    item = payload.get("item") or {}
-    sas_token = payload.get("sas_token")
     base_audio_url = workflow_settings.get("audio_base_url")
-    return workflow.process_audio_file(
-        item=item,
-        sas_token=sas_token,
-        base_audio_url=base_audio_url,
+    loop = asyncio.get_running_loop()
+    return list(
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    _transcription_executor,
+                    functools.partial(
+                        workflow.process_audio_file,
+                        item=item,
+                        sas_token=sas_token,
+                        base_audio_url=base_audio_url,
+                    ),
+                )
+                for item in items
+            )
+        )
     )
 
+
+def _checkpoint_source_key(
+    source_storage: Optional[Dict[str, Any]],
+    target_directory: Optional[str],
+) -> str:
+    """Return a short stable key for the listing source of an orchestration."""
+    if source_storage:
+        conn_parts = dict(
+            part.split("=", 1)
+            for part in (source_storage.get("connection_string") or "").split(";")
+            if "=" in part
+        )
+        identity = [
+            "storage",
+            conn_parts.get("AccountName", ""),
+            source_storage.get("container_name", ""),
+            source_storage.get("directory", ""),
+        ]
+    else:
+        identity = ["directory", target_directory or ""]
+    return hashlib.sha256(json.dumps(identity).encode("utf-8")).hexdigest()[:16]
+
+
+def _processed_items_prefix(payload: Dict[str, Any]) -> str:
+    return PROCESSED_ITEMS_PREFIX.format(day=payload.get("day"), source=payload.get("source"))
+
+
+def _processed_items_container_client(payload: Dict[str, Any]):
+    workflow = _build_workflow(payload.get("workflow_settings") or {})
+    return workflow.container_client
+
+
+@app.activity_trigger(input_name="payload")
+def LoadProcessedItems(payload: Dict[str, Any]) -> List[str]:  # noqa: N802
+    container_client = _processed_items_container_client(payload)
+    if container_client is None:
+        return []
+    checkpoint_names = list(
+        container_client.list_blob_names(name_starts_with=_processed_items_prefix(payload))
+    )
+
+    def read_checkpoint(name: str) -> List[str]:
+        try:
+            return _json_loads(container_client.get_blob_client(name).download_blob().readall())
+        except ResourceNotFoundError:
+            return []
+
+    with ThreadPoolExecutor(max_workers=CHECKPOINT_DOWNLOAD_WORKERS) as executor:
+        return sorted({path for paths in executor.map(read_checkpoint, checkpoint_names) for path in paths})
+
+
+@app.activity_trigger(input_name="payload")
+def SaveProcessedItems(payload: Dict[str, Any]) -> int:  # noqa: N802
+    container_client = _processed_items_container_client(payload)
+    if container_client is None:
+        return 0
+    # One blob per finished batch; a retried activity overwrites its own blob
+    blob_client = container_client.get_blob_client(
+        f"{_processed_items_prefix(payload)}{payload.get('checkpoint_name')}.json"
+    )
+    audio_paths = payload.get("audio_paths") or []
+    body = orjson.dumps(audio_paths) if orjson is not None else json.dumps(audio_paths).encode("utf-8")
+    blob_client.upload_blob(body, overwrite=True)
+    logger.info("Recorded %d processed audio items in %s", len(audio_paths), blob_client.blob_name)
+    return len(audio_paths)
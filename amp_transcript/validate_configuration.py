@@ -6,28 +6,194 @@ before running the transcription workflow. Run this first to ensure
 everything is properly set up.
 """
 
+import argparse
+import atexit
+import functools
+import hashlib
+import importlib
+import importlib.util
+import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from threading import Lock
+
+
+# Every environment variable the checks read; snapshotted once in main()
+ENV_VARS = (
+    "VOICEGAIN_TOKEN",
+    "SQL_CONNECTION_STRING",
+    "BLOB_CONNECTION_STRING",
+    "SAS_TOKEN",
+    "AZURE_FUNCTION_URL",
+    "COMPANY_GUID",
+    "EVALUATION_DATE",
+    "VALIDATION_TIMEOUT",
+)
+
+# Connectivity checks fail fast: seconds allowed to establish a connection,
+# and to wait for a response (overridable with VALIDATION_TIMEOUT)
+CONNECT_TIMEOUT = 3
+DEFAULT_READ_TIMEOUT = 5
+
+
+def get_read_timeout(env):
+    """Return the response timeout in seconds, honoring VALIDATION_TIMEOUT"""
+    try:
+        timeout = float(env.get("VALIDATION_TIMEOUT") or DEFAULT_READ_TIMEOUT)
+    except ValueError:
+        return DEFAULT_READ_TIMEOUT
+    return timeout if timeout > 0 else DEFAULT_READ_TIMEOUT
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one validation check"""
+    name: str
+    ok: bool
+    message: str = ""
+    duration_ms: float = 0.0
+    # Optional checks are reported but do not fail validation
+    required: bool = True
+
+
+def timed(check):
+    """Decorator that records how long a check took on its CheckResult"""
+    @functools.wraps(check)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = check(*args, **kwargs)
+        result.duration_ms = round((time.perf_counter() - start) * 1000, 3)
+        return result
+    return wrapper
+
+
+# Pool that runs the connectivity checks. Kept for the life of the process
+# so repeated validations (e.g. from a long-running service) reuse the same
+# few threads; they are only started on first use.
+_check_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="validate")
+
+# Connectivity results are reused for this long while the configuration is
+# unchanged, so CI re-runs skip the network probes (--force re-checks)
+RESULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "amp_transcript", "validate.json")
+RESULT_CACHE_TTL_SECONDS = 300
+
+
+def _result_cache_key(env, test_names):
+    """Hash the configuration and the checks run, without storing secrets"""
+    snapshot = repr((sorted(env.items()), test_names)).encode("utf-8")
+    return hashlib.blake2b(snapshot).hexdigest()
+
+
+def load_cached_results(key):
+    """Return cached connectivity outcomes for this configuration, if fresh"""
+    try:
+        with open(RESULT_CACHE_PATH, "r", encoding="utf-8") as handle:
+            cache = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if cache.get("key") != key or time.time() - cache.get("ts", 0) > RESULT_CACHE_TTL_SECONDS:
+        return None
+    try:
+        return [CheckResult(**result) for result in cache.get("results", [])]
+    except TypeError:
+        # Written by an older version of this script
+        return None
+
+
+def save_cached_results(key, results):
+    """Store connectivity outcomes; the cache is best effort"""
+    try:
+        os.makedirs(os.path.dirname(RESULT_CACHE_PATH), exist_ok=True)
+        with open(RESULT_CACHE_PATH, "w", encoding="utf-8") as handle:
+            json.dump({"key": key, "ts": time.time(), "results": [asdict(r) for r in results]}, handle)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _load_module(name):
+    """Import a module once per process; None when it is not installed"""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _import_once(name):
+    """Return a cached module import; raises ImportError if it is missing"""
+    # Heavy packages are only imported by the check that needs them, and a
+    # package found missing is not imported again by every later check
+    module = _load_module(name)
+    if module is None:
+        raise ImportError(f"No module named {name!r}")
+    return module
+
+
+# HTTP session shared by the VoiceGain and Azure Function checks so they reuse
+# pooled connections. Created lazily: requests may not be installed. It stays
+# open across validation runs in the same process, so repeat checks skip the
+# DNS lookup, TCP connect and TLS handshake, and is closed at exit.
+_http_session = None
+_http_session_lock = Lock()
+
+
+def get_http_session():
+    """Return the shared HTTP session, creating it on first use"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            requests = _import_once("requests")
+            _http_session = requests.Session()
+            _http_session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4),
+            )
+        return _http_session
+
+
+@atexit.register
+def close_http_session():
+    """Close the shared HTTP session if one was created"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+
+
+# Status markers, built once. Colored for terminals; plain words when output
+# is redirected so log files do not collect ANSI escape codes.
+_USE_COLOR = sys.stdout.isatty()
+STATUS_OK = "\033[92m✓\033[0m" if _USE_COLOR else "OK"
+STATUS_FAIL = "\033[91m✗\033[0m" if _USE_COLOR else "FAIL"
+
+
+def format_status(test_name, success, message=""):
+    """Format a test status line with colored output"""
+    line = f"{STATUS_OK if success else STATUS_FAIL} {test_name}"
+    return f"{line}: {message}\n" if message else f"{line}\n"
 
 
 def print_status(test_name, success, message=""):
     """Print test status with colored output"""
-    status = "✓" if success else "✗"
-    color = "\033[92m" if success else "\033[91m"
-    reset = "\033[0m"
-    print(f"{color}{status}{reset} {test_name}", end="")
-    if message:
-        print(f": {message}")
-    else:
-        print()
+    print(format_status(test_name, success, message), end="")
     return success
 
 
+def format_results(results):
+    """Format CheckResults as status lines"""
+    return "".join(format_status(r.name, r.ok, r.message) for r in results)
+
+
+@timed
 def test_python_version():
     """Check Python version"""
     version = sys.version_info
     success = version.major == 3 and version.minor >= 7
-    return print_status(
+    return CheckResult(
         "Python version",
         success,
         f"Python {version.major}.{version.minor}.{version.micro}" + 
@@ -35,50 +201,55 @@ def test_python_version():
     )
 
 
+# Packages the checks need, with what each is used for
+PACKAGES = {
+    "requests": "HTTP client library",
+    "pyodbc": "SQL Server driver",
+    "azure.storage.blob": "Azure Blob Storage client"
+}
+
+
+@timed
+def test_package(package):
+    """Test if a required package is installed"""
+    description = PACKAGES[package]
+    # Only locate the package; the checks that use it import it later
+    try:
+        installed = importlib.util.find_spec(package) is not None
+    except ImportError:
+        # A parent package (e.g. azure) is missing
+        installed = False
+    if installed:
+        return CheckResult(f"Package: {package}", True, description)
+    return CheckResult(f"Package: {package}", False, f"NOT INSTALLED - {description}")
+
+
 def test_package_imports():
-    """Test if required packages can be imported"""
-    packages = {
-        "requests": "HTTP client library",
-        "pyodbc": "SQL Server driver",
-        "azure.storage.blob": "Azure Blob Storage client"
-    }
-    
-    all_success = True
-    for package, description in packages.items():
-        try:
-            __import__(package)
-            print_status(f"Package: {package}", True, description)
-        except ImportError:
-            print_status(f"Package: {package}", False, f"NOT INSTALLED - {description}")
-            all_success = False
-    
-    return all_success
+    """Test if required packages are installed; one result per package"""
+    return [test_package(package) for package in PACKAGES]
 
 
+@timed
 def test_odbc_drivers():
     """Check available ODBC drivers"""
     try:
-        import pyodbc
+        pyodbc = _import_once("pyodbc")
         drivers = pyodbc.drivers()
         
         if not drivers:
-            print_status("ODBC drivers", False, "No ODBC drivers found")
-            return False
+            return CheckResult("ODBC drivers", False, "No ODBC drivers found")
         
         sql_server_drivers = [d for d in drivers if "SQL Server" in d]
         if sql_server_drivers:
-            print_status("ODBC drivers", True, f"Found: {', '.join(sql_server_drivers)}")
-            return True
+            return CheckResult("ODBC drivers", True, f"Found: {', '.join(sql_server_drivers)}")
         else:
-            print_status("ODBC drivers", False, f"No SQL Server drivers. Available: {', '.join(drivers)}")
-            return False
+            return CheckResult("ODBC drivers", False, f"No SQL Server drivers. Available: {', '.join(drivers)}")
     except ImportError:
-        print_status("ODBC drivers", False, "pyodbc not installed")
-        return False
+        return CheckResult("ODBC drivers", False, "pyodbc not installed")
 
 
-def test_environment_variables():
-    """Check if environment variables are set"""
+def test_environment_variables(env):
+    """Check if environment variables are set; one result per variable"""
     required_vars = {
         "VOICEGAIN_TOKEN": "VoiceGain API bearer token",
         "SQL_CONNECTION_STRING": "SQL Server connection string",
@@ -92,171 +263,278 @@ def test_environment_variables():
         "EVALUATION_DATE": "Evaluation date (can be passed as parameter)"
     }
     
-    all_success = True
-    
-    print("\n📋 Required Environment Variables:")
-    for var, description in required_vars.items():
-        value = os.getenv(var)
-        if value:
-            masked = value[:10] + "..." if len(value) > 10 else value
-            print_status(var, True, f"{description} (set: {masked})")
-        else:
-            print_status(var, False, f"{description} - NOT SET")
-            all_success = False
+    # (variables, required, characters shown before masking)
+    sections = [
+        (required_vars, True, 10),
+        (optional_vars, False, 20),
+    ]
     
-    print("\n📋 Optional Environment Variables:")
-    for var, description in optional_vars.items():
-        value = os.getenv(var)
-        if value:
-            masked = value[:20] + "..." if len(value) > 20 else value
-            print_status(var, True, f"{description} (set: {masked})")
-        else:
-            print_status(var, True, f"{description} - not set (optional)")
-    
-    return all_success
+    results = []
+    for variables, required, shown in sections:
+        for var, description in variables.items():
+            value = env.get(var)
+            if value:
+                masked = value[:shown] + "..." if len(value) > shown else value
+                results.append(CheckResult(var, True, f"{description} (set: {masked})", required=required))
+            elif required:
+                results.append(CheckResult(var, False, f"{description} - NOT SET"))
+            else:
+                results.append(CheckResult(var, True, f"{description} - not set (optional)", required=False))
+    return results
 
 
-def test_sql_connection():
+@timed
+def test_sql_connection(env):
     """Test SQL Server connectivity"""
-    connection_string = os.getenv("SQL_CONNECTION_STRING")
+    connection_string = env.get("SQL_CONNECTION_STRING")
     
     if not connection_string:
-        print_status("SQL connection", False, "No connection string configured")
-        return False
+        return CheckResult("SQL connection", False, "No connection string configured")
     
     try:
-        import pyodbc
-        conn = pyodbc.connect(connection_string, timeout=10)
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1")
-        cursor.fetchone()
-        conn.close()
-        print_status("SQL connection", True, "Successfully connected")
-        return True
+        pyodbc = _import_once("pyodbc")
+        # A successful login already proves network, auth and the TDS
+        # handshake, so no query is needed. pyodbc's login timeout only
+        # accepts whole seconds.
+        pyodbc.connect(connection_string, timeout=max(1, round(get_read_timeout(env)))).close()
+        return CheckResult("SQL connection", True, "Successfully connected")
     except ImportError:
-        print_status("SQL connection", False, "pyodbc not installed")
-        return False
+        return CheckResult("SQL connection", False, "pyodbc not installed")
     except Exception as e:
-        print_status("SQL connection", False, f"Connection failed: {str(e)[:60]}")
-        return False
+        return CheckResult("SQL connection", False, f"Connection failed: {str(e)[:60]}")
 
 
-def test_blob_storage():
+@timed
+def test_blob_storage(env):
     """Test Azure Blob Storage connectivity"""
-    connection_string = os.getenv("BLOB_CONNECTION_STRING")
+    connection_string = env.get("BLOB_CONNECTION_STRING")
     
     if not connection_string:
-        print_status("Blob storage", False, "No connection string configured")
-        return False
+        return CheckResult("Blob storage", False, "No connection string configured")
     
     try:
-        from azure.storage.blob import BlobServiceClient
-        client = BlobServiceClient.from_connection_string(connection_string)
-        # Try to list containers (lightweight operation)
-        list(client.list_containers(max_results=1))
-        print_status("Blob storage", True, "Successfully connected")
-        return True
+        BlobServiceClient = _import_once("azure.storage.blob").BlobServiceClient
+        timeout = get_read_timeout(env)
+        client = BlobServiceClient.from_connection_string(
+            connection_string,
+            connection_timeout=min(CONNECT_TIMEOUT, timeout),
+            read_timeout=timeout,
+        )
+        # Single authenticated GET that returns a small header-only response
+        client.get_account_information()
+        return CheckResult("Blob storage", True, "Successfully connected")
     except ImportError:
-        print_status("Blob storage", False, "azure-storage-blob not installed")
-        return False
+        return CheckResult("Blob storage", False, "azure-storage-blob not installed")
     except Exception as e:
-        print_status("Blob storage", False, f"Connection failed: {str(e)[:60]}")
-        return False
+        return CheckResult("Blob storage", False, f"Connection failed: {str(e)[:60]}")
 
 
-def test_voicegain_api():
+@timed
+def test_voicegain_api(env):
     """Test VoiceGain API connectivity"""
-    token = os.getenv("VOICEGAIN_TOKEN")
+    token = env.get("VOICEGAIN_TOKEN")
     
     if not token:
-        print_status("VoiceGain API", False, "No token configured")
-        return False
+        return CheckResult("VoiceGain API", False, "No token configured")
     
     try:
-        import requests
+        session = get_http_session()
+        url = "https://api.voicegain.ai/v1/asr/transcribe"
         headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(
-            "https://api.voicegain.ai/v1/asr/transcribe",
-            headers=headers,
-            timeout=10
-        )
+        timeout = (CONNECT_TIMEOUT, get_read_timeout(env))
+        # HEAD gives the same auth status without downloading the listing;
+        # if the endpoint does not allow HEAD (405), fall back to GET so the
+        # token is still actually checked
+        response = session.head(url, headers=headers, timeout=timeout, allow_redirects=False)
+        if response.status_code == 405:
+            response = session.get(url, headers=headers, timeout=timeout)
         
         if response.status_code == 200:
-            print_status("VoiceGain API", True, "Authentication successful")
-            return True
+            return CheckResult("VoiceGain API", True, "Authentication successful")
         elif response.status_code == 401:
-            print_status("VoiceGain API", False, "Invalid token (401 Unauthorized)")
-            return False
+            return CheckResult("VoiceGain API", False, "Invalid token (401 Unauthorized)")
         else:
-            print_status("VoiceGain API", False, f"Unexpected status: {response.status_code}")
-            return False
+            return CheckResult("VoiceGain API", False, f"Unexpected status: {response.status_code}")
     except ImportError:
-        print_status("VoiceGain API", False, "requests not installed")
-        return False
+        return CheckResult("VoiceGain API", False, "requests not installed")
     except Exception as e:
-        print_status("VoiceGain API", False, f"Connection failed: {str(e)[:60]}")
-        return False
+        return CheckResult("VoiceGain API", False, f"Connection failed: {str(e)[:60]}")
 
 
-def test_azure_function():
+@timed
+def test_azure_function(env):
     """Test Azure Function connectivity (optional)"""
-    function_url = os.getenv("AZURE_FUNCTION_URL")
+    function_url = env.get("AZURE_FUNCTION_URL")
     
     if not function_url:
-        print_status("Azure Function", True, "Not configured (will use local formatting)")
-        return True
+        return CheckResult("Azure Function", True, "Not configured (will use local formatting)", required=False)
     
     try:
-        import requests
-        # Try a simple GET request (most Azure Functions respond to GET)
-        response = requests.get(function_url, timeout=10)
+        # A HEAD request proves reachability without downloading a body
+        response = get_http_session().head(
+            function_url,
+            timeout=(CONNECT_TIMEOUT, get_read_timeout(env)),
+            allow_redirects=False
+        )
         
-        # Accept any response that's not a connection error
-        print_status("Azure Function", True, f"Reachable (status: {response.status_code})")
-        return True
+        # Accept any response that's not a connection error; 401/403/405
+        # still show the function app is up and answering
+        return CheckResult("Azure Function", True, f"Reachable (status: {response.status_code})", required=False)
     except ImportError:
-        print_status("Azure Function", False, "requests not installed")
-        return False
+        return CheckResult("Azure Function", False, "requests not installed", required=False)
     except Exception as e:
-        print_status("Azure Function", False, f"Not reachable: {str(e)[:60]}")
-        return False
+        return CheckResult("Azure Function", False, f"Not reachable: {str(e)[:60]}", required=False)
 
 
-def main():
-    """Run all validation tests"""
-    print("="*70)
-    print("🔍 Transcription Workflow - Configuration Validation")
-    print("="*70)
+def validate(env, force=False, profile=None, echo=True):
+    """Run all validation tests against one configuration
     
-    print("\n📦 System Requirements:")
-    results = []
-    results.append(test_python_version())
-    results.append(test_package_imports())
-    results.append(test_odbc_drivers())
+    Returns (exit code, list of CheckResult). With echo=False nothing is
+    printed, for callers that report the results themselves (e.g. --json).
+    """
+    def show(text):
+        if echo:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+    
+    show("="*70 + "\n🔍 Transcription Workflow - Configuration Validation\n")
+    if profile:
+        show(f"   Profile: {profile}\n")
+    show("="*70 + "\n")
+    
+    package_results = test_package_imports()
+    installed_packages = {
+        package: result.ok
+        for package, result in zip(PACKAGES, package_results)
+    }
+    system_results = [test_python_version(), *package_results]
+    # Without pyodbc the driver check could only repeat that it is missing
+    if installed_packages.get("pyodbc"):
+        system_results.append(test_odbc_drivers())
+    show("\n📦 System Requirements:\n" + format_results(system_results))
     
-    print("\n🔑 Configuration:")
-    results.append(test_environment_variables())
+    env_results = test_environment_variables(env)
+    show(
+        "\n🔑 Configuration:\n"
+        "\n📋 Required Environment Variables:\n"
+        + format_results(r for r in env_results if r.required)
+        + "\n📋 Optional Environment Variables:\n"
+        + format_results(r for r in env_results if not r.required)
+    )
     
-    print("\n🔌 Connectivity Tests:")
-    results.append(test_sql_connection())
-    results.append(test_blob_storage())
-    results.append(test_voicegain_api())
-    test_azure_function()  # Optional, don't include in results
+    show("\n🔌 Connectivity Tests:\n")
+    # (test, package it needs)
+    connectivity_tests = [
+        (test_sql_connection, "pyodbc"),
+        (test_blob_storage, "azure.storage.blob"),
+        (test_voicegain_api, "requests"),
+        (test_azure_function, "requests"),
+    ]
+    # A missing package has already failed validation above, so its checks
+    # are skipped rather than reported a second time
+    connectivity_tests = [
+        test
+        for test, package in connectivity_tests
+        if installed_packages.get(package)
+    ]
+    cache_key = _result_cache_key(env, [test.__name__ for test in connectivity_tests])
+    connectivity_results = None if force else load_cached_results(cache_key)
+    if connectivity_results is not None:
+        show("(cached result from the last 5 minutes; use --force to re-check)\n")
+    else:
+        # Each check is a blocking network round-trip, so run them side by
+        # side and report the results in a fixed order afterwards
+        connectivity_results = list(_check_executor.map(lambda test: test(env), connectivity_tests))
+        # Only passing runs are cached, so a fixed problem is re-checked
+        if connectivity_results and all(r.ok for r in connectivity_results):
+            save_cached_results(cache_key, connectivity_results)
+    show(format_results(connectivity_results))
     
-    print("\n" + "="*70)
+    results = system_results + env_results + connectivity_results
+    show("\n" + "="*70 + "\n")
     
-    if all(results):
-        print("✅ All validations passed! You're ready to run the workflow.")
-        print("\nRun the workflow with:")
-        print("  python transcription_workflow.py")
-        return 0
+    if all(r.ok for r in results if r.required):
+        show("✅ All validations passed! You're ready to run the workflow.\n")
+        show("\nRun the workflow with:\n")
+        show("  python transcription_workflow.py\n")
+        return 0, results
     else:
-        print("❌ Some validations failed. Please fix the issues above.")
-        print("\nFor help, see:")
-        print("  - TRANSCRIPTION_WORKFLOW_README.md")
-        print("  - transcription.env.example")
-        print("  - requirements_transcription.txt")
-        return 1
+        show("❌ Some validations failed. Please fix the issues above.\n")
+        show("\nFor help, see:\n")
+        show("  - TRANSCRIPTION_WORKFLOW_README.md\n")
+        show("  - transcription.env.example\n")
+        show("  - requirements_transcription.txt\n")
+        return 1, results
+
+
+def load_env_file(path):
+    """Read the validated variables from a dotenv file"""
+    from dotenv import dotenv_values
+    values = dotenv_values(path)
+    return {var: values.get(var) for var in ENV_VARS}
+
+
+def main(argv=None):
+    """Validate the current environment, or each --env-files profile"""
+    parser = argparse.ArgumentParser(description="Validate transcription workflow configuration")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="re-run connectivity checks even if a recent cached result exists",
+    )
+    parser.add_argument(
+        "--env-files",
+        nargs="+",
+        metavar="FILE",
+        help="validate each dotenv file (e.g. dev/stage/prod) in one run instead of the current environment",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="print the check results as JSON instead of the report",
+    )
+    args = parser.parse_args(argv)
+    echo = not args.json
+    
+    if not args.env_files:
+        # Read the environment once so every check sees the same values
+        env = {var: os.environ.get(var) for var in ENV_VARS}
+        exit_code, results = validate(env, force=args.force, echo=echo)
+        if args.json:
+            print(json.dumps([asdict(r) for r in results], indent=2))
+        return exit_code
+    
+    # Profiles share the imports, check pool and HTTP session of this process
+    exit_code = 0
+    profiles = {}
+    for index, path in enumerate(args.env_files):
+        if index and echo:
+            print()
+        if not os.path.isfile(path):
+            missing = CheckResult(f"Profile {path}", False, "file not found")
+            profiles[path] = [missing]
+            if echo:
+                print_status(missing.name, missing.ok, missing.message)
+            exit_code = 1
+            continue
+        try:
+            env = load_env_file(path)
+        except ImportError:
+            # Applies to every profile, so stop here; --json still reports it
+            missing_dotenv = CheckResult("Profile", False, "python-dotenv is required for --env-files")
+            profiles[path] = [missing_dotenv]
+            if echo:
+                print_status(missing_dotenv.name, missing_dotenv.ok, missing_dotenv.message)
+            exit_code = 1
+            break
+        profile_exit_code, profiles[path] = validate(env, force=args.force, profile=path, echo=echo)
+        exit_code = max(exit_code, profile_exit_code)
+    if args.json:
+        print(json.dumps(
+            {path: [asdict(r) for r in results] for path, results in profiles.items()},
+            indent=2,
+        ))
+    return exit_code
 
 
 if __name__ == "__main__":
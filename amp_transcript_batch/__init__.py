@@ -0,0 +1,6 @@
+"""
+Batch-enabled transcription workflow (Azure Durable Functions app).
+
+Installed as a package so standalone scripts can import
+``amp_transcript_batch.function_app`` directly.
+"""
@@ -2,29 +2,227 @@
 Azure Durable Functions implementation of the transcription workflow.
 The orchestrator can discover work items either inside an Azure Storage
 container (via Blob/SFTP endpoint) or a local directory, and schedules
-each transcription as a separate activity function.
+each transcription as a sub-orchestration that submits the audio, polls
+VoiceGain on durable timers and stores the transcript through activities.
 """
 
+import functools
 import json
 import logging
 import os
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import groupby, islice, product
 from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, quote, urlsplit, urlunsplit
 
 import azure.durable_functions as df  # type: ignore[import]
 import azure.functions as func  # type: ignore[import]
 import requests
-from azure.storage.blob import BlobServiceClient
+from azure.storage.blob import BlobServiceClient, ContentSettings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses metadata manifests several times faster than the stdlib;
+# fall back to json if it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Both accept bytes, and orjson.JSONDecodeError subclasses json.JSONDecodeError
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# ijson is optional; when installed with a C backend, very large metadata
+# arrays are parsed record by record instead of being read into memory in one
+# piece. Its pure-Python backend is far slower than _json_loads, so it is
+# not used.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+if ijson is not None and ijson.backend.__name__.rsplit(".", 1)[-1] not in ("yajl2_c", "yajl2_cffi"):
+    ijson = None
 
 # Configure module-level logger for Azure Functions
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Metadata blobs are each a separate download, so they are fetched in
+# parallel rather than one round-trip at a time
+METADATA_DOWNLOAD_WORKERS = 32
+
+# Local metadata files larger than this are streamed with ijson if a C backend
+# is available
+METADATA_STREAM_THRESHOLD_BYTES = 32 * 1024 * 1024
+
+
+def _create_http_session() -> requests.Session:
+    """
+    Build a keep-alive session for VoiceGain and the formatter function.
+
+    Polls and transcript downloads (GET) are retried on throttling and
+    transient server errors, honoring Retry-After. Submissions are POSTs and
+    only retried on connection failures, so a file cannot be submitted twice;
+    submit_transcription_request handles 429 itself.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        # Hand the last response back so the workflow's own status handling runs
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+# Durable polling schedule for a submitted session: wait this long between
+# status checks, and give up after this many checks (20 minutes in total)
+POLL_DELAY_SECONDS = 20
+POLL_MAX_ITERATIONS = 60
+
+
+def _case_variant_suffixes(extensions: List[str]) -> Tuple[str, ...]:
+    """
+    Expand extensions into every upper/lower case spelling (e.g. '.mp3' ->
+    '.mp3', '.mP3', ..., '.MP3') so names can be matched with a single
+    str.endswith(tuple) call instead of lowercasing each name first.
+    """
+    suffixes = set()
+    for ext in extensions:
+        choices = [{ch.lower(), ch.upper()} for ch in ext]
+        suffixes.update("".join(chars) for chars in product(*choices))
+    return tuple(suffixes)
+
+
+@functools.lru_cache(maxsize=4)
+def _blob_service_client(connection_string: str) -> BlobServiceClient:
+    """
+    Return a BlobServiceClient per connection string, shared by every workflow
+    in this worker so warm activities skip re-parsing the connection string
+    and reuse the client's connection pool.
+    """
+    return BlobServiceClient.from_connection_string(connection_string)
+
+
+def _append_sas(url: str, sas_token: str) -> str:
+    """
+    Append a SAS token to a URL's query string. Tolerates tokens given with a
+    leading '?', and leaves the URL unchanged if the token's parameters are
+    already there (e.g. when a retried item arrives with its audio_url already
+    signed).
+    """
+    sas_token = sas_token.lstrip("?&")
+    parts = urlsplit(url)
+    if not sas_token:
+        return url
+    existing = set(parse_qsl(parts.query, keep_blank_values=True))
+    if existing.issuperset(parse_qsl(sas_token, keep_blank_values=True)):
+        return url
+    query = f"{parts.query}&{sas_token}" if parts.query else sas_token
+    return urlunsplit(parts._replace(query=query))
+
+
+# Path separators flattened out of transcript blob names
+_SANITIZE = str.maketrans({"/": "_", "\\": "_"})
+
+# Audio extensions replaced by .txt in transcript names
+_AUDIO_FILE_EXTENSIONS = frozenset({".mp3", ".wav", ".m4a"})
+
+# Transcripts are uploaded as UTF-8 text; built once and shared by all uploads
+_TRANSCRIPT_CONTENT_SETTINGS = ContentSettings(content_type="text/plain; charset=utf-8")
+
+
+# Shared by every workflow in this worker process, so warm activities reuse
+# open connections instead of paying a TCP and TLS handshake per item
+_SESSION = _create_http_session()
+
 
 class TranscriptionWorkflow:
     """Encapsulates the transcription process for a single audio asset."""
 
+    # Submission settings shared by every request, built once at import; only
+    # the audio source differs, and it replaces the placeholder key in a copy
+    _PAYLOAD_TEMPLATE: Dict[str, Any] = {
+        "modelName": "VoiceGain-Omega:2",
+        "audio": None,  # Filled in per request
+        "settings": {
+            "asr": {
+                "diarization": {
+                    "maxSpeakers": 3,
+                    "minSpeakers": 2,
+                }
+            },
+            "formatters": [
+                {"type": "digits"},
+                {"parameters": {"enabled": "true"}, "type": "basic"},
+                {"parameters": {"CC": True, "EMAIL": "true"}, "type": "enhanced"},
+                {"parameters": {"mask": "partial"}, "type": "profanity"},
+                {"parameters": {"lang": "en-US"}, "type": "spelling"},
+                {
+                    "parameters": {
+                        "ADDRESS": "full",
+                        "CARDINAL": "full",
+                        "CC": "full",
+                        "DATE": "full",
+                        "EMAIL": "full",
+                        "EVENT": "full",
+                        "FAC": "full",
+                        "GPE": "full",
+                        "LANGUAGE": "full",
+                        "LAW": "full",
+                        "NORP": "full",
+                        "MONEY": "full",
+                        "ORDINAL": "full",
+                        "ORG": "full",
+                        "PERCENT": "full",
+                        "PERSON": "full",
+                        "PHONE": "full",
+                        "PRODUCT": "full",
+                        "QUANTITY": "full",
+                        "SSN": "full",
+                        "TIME": "full",
+                        "WORK_OF_ART": "full",
+                        "ZIP": "full",
+                    },
+                    "type": "redact",
+                },
+                {
+                    "parameters": {
+                        "mask": "full",
+                        "options": "IA",
+                        "pattern": "[1-9][0-9]{3}[ ]?[a-zA-Z]{2}",
+                    },
+                    "type": "regex",
+                },
+                {
+                    "parameters": {
+                        "mask": "full",
+                        "options": "IA",
+                        "pattern": "\\d+\\.",
+                    },
+                    "type": "regex",
+                },
+            ],
+            "preemptible": False,
+        },
+        "sessions": [
+            {
+                "asyncMode": "OFF-LINE",
+                "poll": {"persist": 600000},
+                "content": {
+                    "incremental": ["progress"],
+                    "full": ["transcript", "words"],
+                },
+            }
+        ],
+    }
+
     def __init__(
         self,
         voicegain_bearer_token: str,
@@ -32,16 +230,26 @@ class TranscriptionWorkflow:
         azure_function_url: Optional[str] = None,
         audio_base_url: Optional[str] = None,
         blob_container_name: str = "autoqa",
+        http_session: Optional[requests.Session] = None,
     ) -> None:
         self.voicegain_token = voicegain_bearer_token
+        # Keep-alive session so submit, every poll and the transcript download
+        # reuse connections; defaults to the process-wide pooled session.
+        self.http_session = http_session or _SESSION
         self.azure_function_url = azure_function_url
         self.audio_base_url = audio_base_url.rstrip("/") if audio_base_url else None
         self.blob_service_client = (
-            BlobServiceClient.from_connection_string(blob_connection_string)
+            _blob_service_client(blob_connection_string)
             if blob_connection_string
             else None
         )
         self.blob_container_name = blob_container_name
+        # Building a container client is local; keep one for every upload
+        self.container_client = (
+            self.blob_service_client.get_container_client(blob_container_name)
+            if self.blob_service_client is not None
+            else None
+        )
 
         # Runtime variables populated during execution
         self.session_url: Optional[str] = None
@@ -49,12 +257,34 @@ class TranscriptionWorkflow:
         self.status: str = ""
 
     @staticmethod
-    def _ensure_iterable(value: Any) -> Iterable[Dict[str, Any]]:
-        if isinstance(value, list):
-            return value
-        if isinstance(value, dict):
-            return [value]
-        return []
+    def _read_metadata_file(file_path: str, size: int) -> Any:
+        """Parse a metadata file, streaming large top-level arrays with ijson."""
+        # Read raw bytes: the parser decodes UTF-8 itself
+        with open(file_path, "rb") as handle:
+            if ijson is not None and size > METADATA_STREAM_THRESHOLD_BYTES:
+                starts_with_array = handle.read(64).lstrip()[:1] == b"["
+                handle.seek(0)
+                if starts_with_array:
+                    try:
+                        # use_float keeps numbers JSON-serializable (not Decimal)
+                        return list(ijson.items(handle, "item", use_float=True))
+                    except ijson.JSONError as exc:
+                        raise ValueError(str(exc)) from exc
+            return _json_loads(handle.read())
+
+    @staticmethod
+    def _iter_files(root: str) -> Iterable[os.DirEntry]:
+        """Yield file entries under root, using scandir's cached type info."""
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from TranscriptionWorkflow._iter_files(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError as exc:
+            # Match os.walk, which silently skips unreadable directories
+            logger.debug("Skipping unreadable directory %s: %s", root, exc)
 
     def list_audio_items_from_directory(
         self,
@@ -76,49 +306,55 @@ class TranscriptionWorkflow:
         """
         metadata_extensions = metadata_extensions or [".json"]
         audio_extensions = audio_extensions or [".wav", ".mp3", ".m4a"]
+        # str.endswith accepts a tuple, so each name is checked in one call
+        meta_exts = _case_variant_suffixes(metadata_extensions)
+        audio_exts = _case_variant_suffixes(audio_extensions)
 
         discovered: Dict[str, Dict[str, Any]] = {}
         logger.info("Scanning directory %s for transcription work items", target_directory)
 
-        for root, _, files in os.walk(target_directory):
-            for filename in files:
-                file_path = os.path.join(root, filename)
-                lower_name = filename.lower()
+        for entry in self._iter_files(target_directory):
+            file_path = entry.path
+            filename = entry.name
 
-                if any(lower_name.endswith(ext) for ext in metadata_extensions):
-                    try:
-                        with open(file_path, "r", encoding="utf-8") as handle:
-                            payload = json.load(handle)
-                    except (json.JSONDecodeError, OSError) as exc:
-                        logger.warning(
-                            "Skipping metadata file %s due to error: %s",
-                            file_path,
-                            exc,
-                        )
+            if filename.endswith(meta_exts):
+                try:
+                    payload = self._read_metadata_file(file_path, entry.stat().st_size)
+                except (ValueError, OSError) as exc:
+                    logger.warning(
+                        "Skipping metadata file %s due to error: %s",
+                        file_path,
+                        exc,
+                    )
+                    continue
+
+                # A manifest holds either a list of records or a single record
+                manifest_records = (
+                    payload if isinstance(payload, list)
+                    else (payload,) if isinstance(payload, dict)
+                    else ()
+                )
+                for record in manifest_records:
+                    if not isinstance(record, dict):
+                        continue
+                    audio_path = record.get("audiopath")
+                    if not audio_path:
                         continue
+                    key = audio_path.replace("\\", "/")
+                    # Records are freshly parsed, so annotate them in place
+                    record["audiopath"] = key
+                    record["source_metadata"] = file_path
+                    discovered[key] = record
 
-                    for record in self._ensure_iterable(payload):
-                        if not isinstance(record, dict):
-                            continue
-                        audio_path = record.get("audiopath")
-                        if not audio_path:
-                            continue
-                        key = audio_path.replace("\\", "/")
-                        discovered[key] = {
-                            **record,
-                            "audiopath": key,
-                            "source_metadata": file_path,
-                        }
-
-                elif any(lower_name.endswith(ext) for ext in audio_extensions):
-                    key = os.path.relpath(file_path, target_directory).replace("\\", "/")
-                    discovered.setdefault(
-                        key,
-                        {
-                            "audiopath": key,
-                            "source_metadata": None,
-                        },
-                    )
+            elif filename.endswith(audio_exts):
+                key = os.path.relpath(file_path, target_directory).replace("\\", "/")
+                discovered.setdefault(
+                    key,
+                    {
+                        "audiopath": key,
+                        "source_metadata": None,
+                    },
+                )
 
         records = list(discovered.values())
         logger.info("Discovered %d audio items to process", len(records))
@@ -147,9 +383,13 @@ class TranscriptionWorkflow:
         """
         metadata_extensions = metadata_extensions or [".json"]
         audio_extensions = audio_extensions or [".wav", ".mp3", ".m4a"]
+        # str.endswith accepts a tuple, so each name is checked in one call
+        meta_exts = _case_variant_suffixes(metadata_extensions)
+        audio_exts = _case_variant_suffixes(audio_extensions)
 
-        service_client = BlobServiceClient.from_connection_string(connection_string)
-        container_client = service_client.get_container_client(container_name)
+        container_client = _blob_service_client(connection_string).get_container_client(
+            container_name
+        )
 
         prefix = directory or ""
         if prefix and not prefix.endswith("/"):
@@ -162,18 +402,43 @@ class TranscriptionWorkflow:
             prefix,
         )
 
-        for blob in container_client.list_blobs(name_starts_with=prefix):
-            blob_name = blob.name
-            lower_name = blob_name.lower()
-            rel_name = blob_name[len(prefix) :] if blob_name.startswith(prefix) else blob_name
+        # Collect candidate names first; metadata is downloaded afterwards
+        candidate_names: List[str] = []
+        metadata_names: List[str] = []
+
+        # Only names are needed, so skip deserializing full blob properties
+        for blob_name in container_client.list_blob_names(name_starts_with=prefix):
+            if blob_name.endswith(meta_exts):
+                metadata_names.append(blob_name)
+                candidate_names.append(blob_name)
+            elif blob_name.endswith(audio_exts):
+                candidate_names.append(blob_name)
+
+        def download_metadata(blob_name: str) -> Optional[bytes]:
+            try:
+                return container_client.download_blob(blob_name).readall()
+            except OSError as exc:
+                logger.warning(
+                    "Skipping metadata blob %s due to error: %s",
+                    blob_name,
+                    exc,
+                )
+                return None
+
+        with ThreadPoolExecutor(max_workers=METADATA_DOWNLOAD_WORKERS) as executor:
+            metadata_blobs = dict(
+                zip(metadata_names, executor.map(download_metadata, metadata_names))
+            )
 
-            if any(lower_name.endswith(ext) for ext in metadata_extensions):
+        # Parse and merge in listing order so metadata overrides behave as before
+        for blob_name in candidate_names:
+            if blob_name in metadata_blobs:
+                blob_data = metadata_blobs[blob_name]
+                if blob_data is None:
+                    continue
                 try:
-                    blob_data = container_client.download_blob(blob_name).content_as_text(
-                        encoding="utf-8"
-                    )
-                    payload = json.loads(blob_data)
-                except (json.JSONDecodeError, OSError) as exc:
+                    payload = _json_loads(blob_data)
+                except json.JSONDecodeError as exc:
                     logger.warning(
                         "Skipping metadata blob %s due to error: %s",
                         blob_name,
@@ -181,20 +446,25 @@ class TranscriptionWorkflow:
                     )
                     continue
 
-                for record in self._ensure_iterable(payload):
+                # A manifest holds either a list of records or a single record
+                manifest_records = (
+                    payload if isinstance(payload, list)
+                    else (payload,) if isinstance(payload, dict)
+                    else ()
+                )
+                for record in manifest_records:
                     if not isinstance(record, dict):
                         continue
                     audio_path = record.get("audiopath")
                     if not audio_path:
                         continue
                     key = audio_path.replace("\\", "/")
-                    discovered[key] = {
-                        **record,
-                        "audiopath": key,
-                        "source_metadata": blob_name,
-                    }
+                    # Records are freshly parsed, so annotate them in place
+                    record["audiopath"] = key
+                    record["source_metadata"] = blob_name
+                    discovered[key] = record
 
-            elif any(lower_name.endswith(ext) for ext in audio_extensions):
+            else:
                 # Use the full blob_name (with directory) as the key
                 key = blob_name.replace("\\", "/")
                 discovered.setdefault(
@@ -217,84 +487,14 @@ class TranscriptionWorkflow:
         }
 
         payload = {
-            "modelName": "VoiceGain-Omega:2",
-            "audio": {"source": {"fromUrl": {"url": audio_url}}},  # type: ignore[dict-item]
-            "settings": {
-                "asr": {
-                    "diarization": {
-                        "maxSpeakers": 3,
-                        "minSpeakers": 2,
-                    }
-                },
-                "formatters": [
-                    {"type": "digits"},
-                    {"parameters": {"enabled": "true"}, "type": "basic"},
-                    {"parameters": {"CC": True, "EMAIL": "true"}, "type": "enhanced"},
-                    {"parameters": {"mask": "partial"}, "type": "profanity"},
-                    {"parameters": {"lang": "en-US"}, "type": "spelling"},
-                    {
-                        "parameters": {
-                            "ADDRESS": "full",
-                            "CARDINAL": "full",
-                            "CC": "full",
-                            "DATE": "full",
-                            "EMAIL": "full",
-                            "EVENT": "full",
-                            "FAC": "full",
-                            "GPE": "full",
-                            "LANGUAGE": "full",
-                            "LAW": "full",
-                            "NORP": "full",
-                            "MONEY": "full",
-                            "ORDINAL": "full",
-                            "ORG": "full",
-                            "PERCENT": "full",
-                            "PERSON": "full",
-                            "PHONE": "full",
-                            "PRODUCT": "full",
-                            "QUANTITY": "full",
-                            "SSN": "full",
-                            "TIME": "full",
-                            "WORK_OF_ART": "full",
-                            "ZIP": "full",
-                        },
-                        "type": "redact",
-                    },
-                    {
-                        "parameters": {
-                            "mask": "full",
-                            "options": "IA",
-                            "pattern": "[1-9][0-9]{3}[ ]?[a-zA-Z]{2}",
-                        },
-                        "type": "regex",
-                    },
-                    {
-                        "parameters": {
-                            "mask": "full",
-                            "options": "IA",
-                            "pattern": "\\d+\\.",
-                        },
-                        "type": "regex",
-                    },
-                ],
-                "preemptible": False,
-            },
-            "sessions": [
-                {
-                    "asyncMode": "OFF-LINE",
-                    "poll": {"persist": 600000},
-                    "content": {
-                        "incremental": ["progress"],
-                        "full": ["transcript", "words"],
-                    },
-                }
-            ],
+            **self._PAYLOAD_TEMPLATE,
+            "audio": {"source": {"fromUrl": {"url": audio_url}}},
         }
 
         # Retry with exponential backoff on 429 errors
         max_retries = 3
         for attempt in range(max_retries):
-            response = requests.post(
+            response = self.http_session.post(
                 "https://api.voicegain.ai/v1/asr/transcribe/async",
                 headers=headers,
                 json=payload,
@@ -323,7 +523,7 @@ class TranscriptionWorkflow:
                     return None
 
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         
         # Should not reach here, but return None as fallback
         return None
@@ -334,8 +534,6 @@ class TranscriptionWorkflow:
         max_iterations: int = 60,
         delay_seconds: int = 20,
     ) -> Tuple[str, str]:
-        headers = {"Authorization": f"Bearer {self.voicegain_token}"}
-
         results = ""
         status = ""
         iteration_count = 0
@@ -343,11 +541,7 @@ class TranscriptionWorkflow:
         while results != "DONE" and iteration_count < max_iterations:
             time.sleep(delay_seconds)
 
-            response = requests.get(session_url, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
-            phase = data.get("progress", {}).get("phase", "")
+            phase = self.check_transcription_status(session_url)
             results = phase
 
             if results == "ERROR":
@@ -371,16 +565,24 @@ class TranscriptionWorkflow:
 
         return results, status
 
+    def check_transcription_status(self, session_url: str) -> str:
+        """Return the current phase of a VoiceGain session with a single GET."""
+        headers = {"Authorization": f"Bearer {self.voicegain_token}"}
+        response = self.http_session.get(session_url, headers=headers, timeout=30)
+        response.raise_for_status()
+        return _json_loads(response.content).get("progress", {}).get("phase", "")
+
     def get_transcript(self, session_url: str) -> Dict[str, Any]:
         headers = {"Authorization": f"Bearer {self.voicegain_token}"}
         transcript_url = f"{session_url}/transcript"
-        response = requests.get(transcript_url, headers=headers, timeout=30)
+        response = self.http_session.get(transcript_url, headers=headers, timeout=30)
         response.raise_for_status()
-        return response.json()
+        # Parse the raw body: response.json() would first decode it to text
+        return _json_loads(response.content)
 
     def format_transcript(self, transcript_data: Dict[str, Any]) -> str:
         if self.azure_function_url:
-            response = requests.post(
+            response = self.http_session.post(
                 self.azure_function_url,
                 json=transcript_data,
                 timeout=30,
@@ -398,35 +600,29 @@ class TranscriptionWorkflow:
         formatted_lines: List[str] = []
 
         if "utterances" in transcript_data:
-            for utterance in transcript_data["utterances"]:
-                speaker = utterance.get("speakerId", "Unknown")
-                text = utterance.get("transcript", "")
-                start_time = utterance.get("start", 0) / 1000
-                formatted_lines.append(f"[{start_time:.2f}s] Speaker {speaker}: {text}")
+            formatted_lines = [
+                f"[{utterance.get('start', 0) / 1000:.2f}s] "
+                f"Speaker {utterance.get('speakerId', 'Unknown')}: {utterance.get('transcript', '')}"
+                for utterance in transcript_data["utterances"]
+            ]
         elif "words" in transcript_data:
-            current_speaker = None
-            current_text: List[str] = []
-
-            for word in transcript_data["words"]:
-                speaker = word.get("speakerId")
-                if speaker != current_speaker:
-                    if current_text:
-                        formatted_lines.append(
-                            f"Speaker {current_speaker}: {' '.join(current_text)}"
-                        )
-                    current_speaker = speaker
-                    current_text = [word.get("text", "")]
-                else:
-                    current_text.append(word.get("text", ""))
-
-            if current_text:
-                formatted_lines.append(
-                    f"Speaker {current_speaker}: {' '.join(current_text)}"
+            # Consecutive words from the same speaker form one line, joined once
+            formatted_lines = [
+                f"Speaker {speaker}: {' '.join([word.get('text', '') for word in group])}"
+                for speaker, group in groupby(
+                    transcript_data["words"],
+                    key=lambda word: word.get("speakerId"),
                 )
+            ]
 
         return "\n".join(formatted_lines)
 
-    def save_transcript_to_blob(self, transcript_text: str, audio_identifier: str) -> Optional[str]:
+    def save_transcript_to_blob(
+        self,
+        transcript_text: str,
+        audio_identifier: str,
+        run_date: Optional[str] = None,
+    ) -> Optional[str]:
         if not self.blob_service_client:
             logger.warning(
                 "Blob connection string not configured. Skipping upload for %s.",
@@ -434,34 +630,37 @@ class TranscriptionWorkflow:
             )
             return None
 
-        sanitized_name = ""
-        if ".mp3" in audio_identifier:
-            sanitized_name = audio_identifier.replace("/", "_").replace("\\", "_").replace(".mp3", ".txt")
-        elif ".wav" in audio_identifier:
-            sanitized_name = audio_identifier.replace("/", "_").replace("\\", "_").replace(".wav", ".txt")
+        # One translate pass flattens the path; the audio extension becomes .txt
+        sanitized_id = audio_identifier.translate(_SANITIZE)
+        stem, ext = os.path.splitext(sanitized_id)
+        sanitized_name = (stem if ext.lower() in _AUDIO_FILE_EXTENSIONS else sanitized_id) + ".txt"
 
-        today = datetime.utcnow().strftime("%Y-%m-%d")
+        # Orchestrated runs pass their start date so every item of a run lands
+        # in the same folder, even when the run crosses midnight
+        today = run_date or datetime.utcnow().strftime("%Y-%m-%d")
         full_blob_path = f"autoqa/transcriptFiles/{today}/{sanitized_name}"
 
-        container_client = self.blob_service_client.get_container_client(
-            self.blob_container_name
+        blob_client = self.container_client.get_blob_client(full_blob_path)
+        # Encoded once up front; long calls produce multi-MB transcripts, which
+        # are split into blocks and uploaded in parallel
+        data = transcript_text.encode("utf-8")
+        blob_client.upload_blob(
+            data,
+            overwrite=True,
+            length=len(data),
+            max_concurrency=4,
+            content_settings=_TRANSCRIPT_CONTENT_SETTINGS,
         )
-        blob_client = container_client.get_blob_client(full_blob_path)
-        blob_client.upload_blob(transcript_text, overwrite=True)
         logger.info("Transcript saved to blob path %s", full_blob_path)
         return full_blob_path
 
-    def process_audio_file(
-        self,
-        item: Dict[str, Any],
-        sas_token: Optional[str] = None,
-        base_audio_url: Optional[str] = None,
+    @staticmethod
+    def new_response_payload(
+        audio_path: Optional[str],
+        audio_url: Optional[str],
     ) -> Dict[str, Any]:
-        audio_path = item.get("audiopath")
-        audio_url = item.get("audio_url")
-        chosen_base_url = base_audio_url or item.get("base_audio_url") or self.audio_base_url
-
-        response_payload: Dict[str, Any] = {
+        """Return the result record reported for one work item."""
+        return {
             "audio_path": audio_path,
             "audio_url": audio_url,
             "success": False,
@@ -470,16 +669,51 @@ class TranscriptionWorkflow:
             "error": None,
         }
 
+    def resolve_audio_url(
+        self,
+        item: Dict[str, Any],
+        sas_token: Optional[str] = None,
+        base_audio_url: Optional[str] = None,
+    ) -> str:
+        """Build the URL VoiceGain downloads a work item's audio from."""
+        audio_path = item.get("audiopath")
+        audio_url = item.get("audio_url")
+        chosen_base_url = base_audio_url or item.get("base_audio_url") or self.audio_base_url
+
+        if not audio_url:
+            if not audio_path:
+                raise ValueError("Missing 'audiopath' or 'audio_url' in work item.")
+            if not chosen_base_url:
+                raise ValueError("Audio base URL not provided for constructing audio_url.")
+            # Blob names may contain '#' or '?', which must not end the path
+            audio_url = f"{chosen_base_url.rstrip('/')}/{quote(audio_path.lstrip('/'), safe='/')}"
+        if sas_token:
+            audio_url = _append_sas(audio_url, sas_token)
+        return audio_url
+
+    def complete_transcription(
+        self,
+        session_url: str,
+        audio_identifier: str,
+        run_date: Optional[str] = None,
+    ) -> Optional[str]:
+        """Download, format and store a finished transcript; returns its blob path."""
+        transcript_data = self.get_transcript(session_url)
+        formatted_transcript = self.format_transcript(transcript_data)
+        return self.save_transcript_to_blob(formatted_transcript, audio_identifier, run_date=run_date)
+
+    def process_audio_file(
+        self,
+        item: Dict[str, Any],
+        sas_token: Optional[str] = None,
+        base_audio_url: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        audio_path = item.get("audiopath")
+        audio_url = item.get("audio_url")
+        response_payload = self.new_response_payload(audio_path, audio_url)
+
         try:
-            if not audio_url:
-                if not audio_path:
-                    raise ValueError("Missing 'audiopath' or 'audio_url' in work item.")
-                if not chosen_base_url:
-                    raise ValueError("Audio base URL not provided for constructing audio_url.")
-                audio_url = f"{chosen_base_url.rstrip('/')}/{audio_path.lstrip('/')}"
-            if sas_token:
-                separator = "&" if "?" in audio_url else "?"
-                audio_url = f"{audio_url}{separator}{sas_token}"
+            audio_url = self.resolve_audio_url(item, sas_token, base_audio_url)
             response_payload["audio_url"] = audio_url
 
             transcription_response = self.submit_transcription_request(audio_url)
@@ -499,13 +733,10 @@ class TranscriptionWorkflow:
                 )
                 return response_payload
 
-            transcript_data = self.get_transcript(self.session_url)
-            formatted_transcript = self.format_transcript(transcript_data)
-            blob_path = self.save_transcript_to_blob(
-                formatted_transcript,
+            response_payload["transcript_blob_path"] = self.complete_transcription(
+                self.session_url,
                 audio_path or audio_url,
             )
-            response_payload["transcript_blob_path"] = blob_path
             response_payload["success"] = True
             return response_payload
 
@@ -540,7 +771,7 @@ def _build_workflow(settings: Dict[str, Any]) -> TranscriptionWorkflow:
 
 @app.orchestration_trigger(context_name="context")
 def transcription_orchestrator(context: df.DurableOrchestrationContext):
-    """Durable orchestrator that fans out transcription activities in batches."""
+    """Durable orchestrator that fans out transcription activities in a sliding window."""
     orchestration_input = context.get_input() or {}
     source_storage = orchestration_input.get("source_storage")
     target_directory = orchestration_input.get("target_directory")
@@ -548,7 +779,7 @@ def transcription_orchestrator(context: df.DurableOrchestrationContext):
     audio_extensions = orchestration_input.get("audio_extensions")
     workflow_settings = orchestration_input.get("workflow_settings", {})
     sas_token = orchestration_input.get("sas_token")
-    batch_size = orchestration_input.get("batch_size", 100)  # Default to 100 per batch
+    batch_size = orchestration_input.get("batch_size", 100)  # Default to 100 in flight
 
     listing_payload = {
         "source_storage": source_storage,
@@ -562,49 +793,48 @@ def transcription_orchestrator(context: df.DurableOrchestrationContext):
         listing_payload,
     )
 
+    # Taken from the orchestration clock, so it is fixed for the whole run and
+    # identical on replay
+    run_date = context.current_utc_datetime.strftime("%Y-%m-%d")
+
     task_inputs = [
         {
             "item": item,
             "workflow_settings": workflow_settings,
             "sas_token": sas_token,
+            "run_date": run_date,
         }
         for item in audio_items
     ]
 
-    # Process in batches sequentially
+    # Keep at most batch_size items in flight: a new item is scheduled as
+    # soon as any running one completes, rather than waiting for a whole
+    # batch to finish. Concurrency per worker is capped separately by
+    # "extensions.durableTask.maxConcurrentActivityFunctions" in host.json.
     all_results = []
     total_items = len(task_inputs)
-    
-    for batch_start in range(0, total_items, batch_size):
-        batch_end = min(batch_start + batch_size, total_items)
-        batch_num = (batch_start // batch_size) + 1
-        total_batches = (total_items + batch_size - 1) // batch_size
-        
-        logger.info(
-            "Processing batch %d/%d (items %d-%d of %d)",
-            batch_num,
-            total_batches,
-            batch_start + 1,
-            batch_end,
-            total_items,
-        )
-        
-        # Create parallel tasks for this batch only
-        batch_tasks = [
-            context.call_activity("ProcessTranscriptionItem", payload)
-            for payload in task_inputs[batch_start:batch_end]
-        ]
-        
-        # Wait for this batch to complete before starting next batch
-        batch_results = yield context.task_all(batch_tasks)
-        all_results.extend(batch_results)
-        
-        logger.info(
-            "Completed batch %d/%d - %d items processed",
-            batch_num,
-            total_batches,
-            len(batch_results),
-        )
+    pending_inputs = iter(task_inputs)
+    in_flight = [
+        context.call_sub_orchestrator("transcription_item_orchestrator", payload)
+        for payload in islice(pending_inputs, batch_size)
+    ]
+
+    logger.info(
+        "Processing %d items with up to %d in flight",
+        total_items,
+        batch_size,
+    )
+
+    while in_flight:
+        finished = yield context.task_any(in_flight)
+        in_flight.remove(finished)
+        all_results.append(finished.result)
+
+        next_payload = next(pending_inputs, None)
+        if next_payload is not None:
+            in_flight.append(
+                context.call_sub_orchestrator("transcription_item_orchestrator", next_payload)
+            )
 
     succeeded = [result for result in all_results if result.get("success")]
     failed = [result for result in all_results if not result.get("success")]
@@ -617,6 +847,92 @@ def transcription_orchestrator(context: df.DurableOrchestrationContext):
     }
 
 
+@app.orchestration_trigger(context_name="context")
+def transcription_item_orchestrator(context: df.DurableOrchestrationContext):
+    """
+    Transcribe one work item. VoiceGain is polled from here with durable
+    timers rather than by sleeping inside an activity, so no activity slot is
+    held while the transcription runs.
+    """
+    payload = context.get_input() or {}
+    workflow_settings = payload.get("workflow_settings") or {}
+
+    result = yield context.call_activity("SubmitTranscriptionItem", payload)
+    session_url = result.pop("session_url", None)
+    if not session_url:
+        return result
+
+    audio_identifier = result["audio_path"] or result["audio_url"]
+    session_payload = {"session_url": session_url, "workflow_settings": workflow_settings}
+    try:
+        phase = ""
+        for _ in range(POLL_MAX_ITERATIONS):
+            # Timer deadlines come from the orchestration clock so replays agree
+            yield context.create_timer(
+                context.current_utc_datetime + timedelta(seconds=POLL_DELAY_SECONDS)
+            )
+            phase = yield context.call_activity("CheckTranscriptionStatus", session_payload)
+            if phase in {"DONE", "ERROR"}:
+                break
+
+        if phase != "DONE":
+            result["status"] = "fail" if phase == "ERROR" else "timeout"
+            if not context.is_replaying:
+                logger.error("Transcription %s for %s", result["status"], audio_identifier)
+            return result
+
+        result["status"] = phase
+        save_payload = {
+            **session_payload,
+            "audio_identifier": audio_identifier,
+            "run_date": payload.get("run_date"),
+        }
+        formatter_url = workflow_settings.get("azure_function_url")
+        if formatter_url:
+            # The formatter call is made by the Durable runtime rather than
+            # from inside an activity, so no activity slot waits on it
+            transcript_data = yield context.call_activity("GetTranscript", session_payload)
+            try:
+                # The durable HTTP result is a plain dict decoded from JSON
+                formatter_response = yield context.call_http(
+                    "POST",
+                    formatter_url,
+                    content=transcript_data,
+                    headers={"Content-Type": "application/json"},
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                if not context.is_replaying:
+                    logger.warning(
+                        "Formatter call failed: %s. Falling back to local formatter.",
+                        exc,
+                    )
+                formatter_response = None
+            if formatter_response and formatter_response.get("statusCode") == 200:
+                save_payload["transcript_text"] = formatter_response.get("content")
+            else:
+                if formatter_response and not context.is_replaying:
+                    logger.warning(
+                        "Formatter function returned %s. Falling back to local formatter.",
+                        formatter_response.get("statusCode"),
+                    )
+                save_payload["transcript_data"] = transcript_data
+            result["transcript_blob_path"] = yield context.call_activity(
+                "SaveTranscript",
+                save_payload,
+            )
+        else:
+            # Formatting locally is cheap, so download, format and upload in
+            # one activity and keep the transcript out of orchestration history
+            result["transcript_blob_path"] = yield context.call_activity(
+                "CompleteTranscriptionItem",
+                save_payload,
+            )
+        result["success"] = True
+    except Exception as exc:  # pylint: disable=broad-except
+        result["error"] = str(exc)
+    return result
+
+
 @app.route(route="transcription/start", methods=["POST"])
 @app.durable_client_input(client_name="client")
 async def http_start(
@@ -682,14 +998,93 @@ def ListTranscriptionItems(payload: Dict[str, Any]) -> List[Dict[str, Any]]:  #
 
 @app.activity_trigger(input_name="payload")
 def ProcessTranscriptionItem(payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+    """
+    Deprecated: transcribe one item end to end inside a single activity.
+
+    Kept for orchestrations started before transcription_item_orchestrator
+    replaced it, and for external callers.
+    """
     workflow_settings = payload.get("workflow_settings") or {}
     workflow = _build_workflow(workflow_settings)
-    item = payload.get("item") or {}
-    sas_token = payload.get("sas_token")
-    base_audio_url = workflow_settings.get("audio_base_url")
     return workflow.process_audio_file(
-        item=item,
-        sas_token=sas_token,
-        base_audio_url=base_audio_url,
+        item=payload.get("item") or {},
+        sas_token=payload.get("sas_token"),
+        base_audio_url=workflow_settings.get("audio_base_url"),
+    )
+
+
+@app.activity_trigger(input_name="payload")
+def SubmitTranscriptionItem(payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+    """Submit one work item; the result carries the session_url to poll."""
+    workflow_settings = payload.get("workflow_settings") or {}
+    item = payload.get("item") or {}
+    audio_path = item.get("audiopath")
+    audio_url = item.get("audio_url")
+    response_payload = TranscriptionWorkflow.new_response_payload(audio_path, audio_url)
+    response_payload["session_url"] = None
+
+    try:
+        workflow = _build_workflow(workflow_settings)
+        audio_url = workflow.resolve_audio_url(
+            item,
+            sas_token=payload.get("sas_token"),
+            base_audio_url=workflow_settings.get("audio_base_url"),
+        )
+        response_payload["audio_url"] = audio_url
+
+        transcription_response = workflow.submit_transcription_request(audio_url)
+        if transcription_response is None:
+            response_payload["status"] = "rate_limited"
+            return response_payload
+
+        response_payload["session_url"] = transcription_response["sessions"][0]["sessionUrl"]
+    except Exception as exc:  # pylint: disable=broad-except
+        response_payload["error"] = str(exc)
+        logger.exception(
+            "Error submitting audio item %s: %s",
+            audio_path or audio_url or "<unknown>",
+            exc,
+        )
+    return response_payload
+
+
+@app.activity_trigger(input_name="payload")
+def CheckTranscriptionStatus(payload: Dict[str, Any]) -> str:  # noqa: N802
+    """Return the current phase of a submitted session."""
+    workflow = _build_workflow(payload.get("workflow_settings") or {})
+    session_url = payload["session_url"]
+    phase = workflow.check_transcription_status(session_url)
+    logger.info("Polled session %s phase=%s", session_url, phase)
+    return phase
+
+
+@app.activity_trigger(input_name="payload")
+def CompleteTranscriptionItem(payload: Dict[str, Any]) -> Optional[str]:  # noqa: N802
+    """Download, format and store a finished transcript; returns its blob path."""
+    workflow = _build_workflow(payload.get("workflow_settings") or {})
+    return workflow.complete_transcription(
+        payload["session_url"],
+        payload["audio_identifier"],
+        run_date=payload.get("run_date"),
     )
 
+
+@app.activity_trigger(input_name="payload")
+def GetTranscript(payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+    """Download the transcript of a finished session."""
+    workflow = _build_workflow(payload.get("workflow_settings") or {})
+    return workflow.get_transcript(payload["session_url"])
+
+
+@app.activity_trigger(input_name="payload")
+def SaveTranscript(payload: Dict[str, Any]) -> Optional[str]:  # noqa: N802
+    """Store a formatted transcript, formatting it locally if the formatter failed."""
+    workflow = _build_workflow(payload.get("workflow_settings") or {})
+    transcript_text = payload.get("transcript_text")
+    if transcript_text is None:
+        transcript_text = workflow._format_transcript_locally(payload.get("transcript_data") or {})
+    return workflow.save_transcript_to_blob(
+        transcript_text,
+        payload["audio_identifier"],
+        run_date=payload.get("run_date"),
+    )
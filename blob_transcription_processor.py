@@ -7,13 +7,17 @@ the transcription workflow, and saves transcripts to a "Transcripts" folder.
 
 import os
 import sys
+import functools
+import itertools
 import logging
 import time
 import json
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+from urllib.parse import quote
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from threading import Condition, Lock
 
 # Configure logging first
 logging.basicConfig(
@@ -29,6 +33,32 @@ MAX_FILES_PER_HOUR = 3750
 SECONDS_PER_HOUR = 3600
 MIN_DELAY_BETWEEN_SUBMISSIONS = max(1.0, SECONDS_PER_HOUR / MAX_FILES_PER_HOUR)  # At least 1 second between submissions
 
+# Files transcribed in parallel per batch (each holds one worker thread while
+# VoiceGain processes it); override with the MAX_CONCURRENCY env var
+MAX_CONCURRENCY = max(1, int(os.getenv("MAX_CONCURRENCY", "200")))
+
+# Blobs up to this size are archived with a synchronous Put Blob From URL;
+# larger ones use the asynchronous copy and wait for it to finish
+SYNC_COPY_MAX_BYTES = 256 * 1024 * 1024
+
+# Lifetime of the read SAS that authorizes the source of synchronous copies
+MOVE_SAS_LIFETIME = timedelta(hours=2)
+# Archive moves run on their own small pool, off the transcription path;
+# override with the MOVE_WORKERS env var
+MOVE_WORKERS = max(1, int(os.getenv("MOVE_WORKERS", "4")))
+MOVE_MAX_ATTEMPTS = 3
+# Source blobs removed per Blob Batch request once archived (service maximum)
+DELETE_BATCH_SIZE = 256
+
+# Folders listed concurrently when scanning a container for audio files;
+# override with the LISTING_WORKERS env var
+LISTING_WORKERS = max(1, int(os.getenv("LISTING_WORKERS", "16")))
+# Blob names requested per listing page (the service maximum)
+LISTING_PAGE_SIZE = 5000
+
+# Path separators flattened to "_" when naming transcript blobs
+_SEP_TRANS = str.maketrans({"/": "_", "\\": "_"})
+
 # Rate limiter state
 _rate_limiter_lock = Lock()
 _submission_times = []  # Track submission timestamps
@@ -72,7 +102,12 @@ else:
     sys.path.insert(0, transcript_path)
     logger.info("Using TranscriptionWorkflow from amp_transcript")
 
+import requests
+from requests.adapters import HTTPAdapter
+from azure.core.exceptions import ResourceNotFoundError
+from azure.core.pipeline.transport import RequestsTransport
 from azure.storage.blob import (
+    BlobPrefix,
     BlobServiceClient, 
     generate_container_sas, 
     ContainerSasPermissions
@@ -90,6 +125,60 @@ except ImportError:
     logger.warning("VoiceGain tracker not available - job tracking disabled")
 
 
+@dataclass(frozen=True)
+class BlobConnInfo:
+    """Account details parsed from a storage connection string."""
+    __slots__ = ("account_name", "account_key", "endpoint_suffix")
+    
+    account_name: str
+    account_key: str
+    endpoint_suffix: str
+
+
+@functools.lru_cache(maxsize=4)
+def parse_connection_string(connection_string: str) -> BlobConnInfo:
+    """Parse a storage connection string once; repeat calls are cached."""
+    conn_parts = dict(part.split('=', 1) for part in connection_string.split(';') if '=' in part)
+    return BlobConnInfo(
+        account_name=conn_parts.get('AccountName', ''),
+        account_key=conn_parts.get('AccountKey', ''),
+        endpoint_suffix=conn_parts.get('EndpointSuffix', 'core.windows.net')
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_blob_service_client(connection_string: str) -> BlobServiceClient:
+    """
+    Return a shared BlobServiceClient for a connection string.
+    
+    Listing, URL generation and every per-file move reuse one client and its
+    connection pool instead of re-parsing the connection string and building
+    a new HTTP pipeline each call. The pool is sized for one connection per
+    thread that can use it at once: the batch workers plus the archive movers,
+    or the listing workers during the scan.
+    """
+    pool_size = max(MAX_CONCURRENCY + MOVE_WORKERS, LISTING_WORKERS)
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=pool_size))
+    return BlobServiceClient.from_connection_string(
+        connection_string,
+        transport=RequestsTransport(session=session, session_owner=False)
+    )
+
+
+def transcript_base_name(audio_identifier: str) -> str:
+    """
+    Return the transcript file name (without extension) for an audio blob:
+    path separators flattened to "_" and a known audio extension dropped.
+    """
+    flat_name = audio_identifier.translate(_SEP_TRANS)
+    root, ext = os.path.splitext(flat_name)
+    if ext.lower() in (".mp3", ".wav", ".m4a"):
+        return root
+    # For other formats, keep the full name
+    return flat_name
+
+
 class CustomTranscriptionWorkflow(TranscriptionWorkflow):
     """Extended TranscriptionWorkflow that saves to 'Transcripts' folder with formatted and raw subfolders"""
     
@@ -120,9 +209,6 @@ class CustomTranscriptionWorkflow(TranscriptionWorkflow):
         job_id: Optional[str] = None
     ):
         """Override to add job tracking during polling"""
-        import requests
-        headers = {"Authorization": f"Bearer {self.voicegain_token}"}
-
         results = ""
         status = ""
         iteration_count = 0
@@ -130,11 +216,18 @@ class CustomTranscriptionWorkflow(TranscriptionWorkflow):
         while results != "DONE" and iteration_count < max_iterations:
             time.sleep(delay_seconds)
 
-            response = requests.get(session_url, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
-            phase = data.get("progress", {}).get("phase", "")
+            # Goes through the pooled session, so polls reuse one connection
+            if hasattr(TranscriptionWorkflow, "check_transcription_status"):
+                phase = self.check_transcription_status(session_url)
+            else:
+                # The amp_transcript fallback has no single-poll helper
+                response = self.http_session.get(
+                    session_url,
+                    headers={"Authorization": f"Bearer {self.voicegain_token}"},
+                    timeout=30
+                )
+                response.raise_for_status()
+                phase = response.json().get("progress", {}).get("phase", "")
             results = phase
 
             if results == "ERROR":
@@ -170,6 +263,23 @@ class CustomTranscriptionWorkflow(TranscriptionWorkflow):
         base_audio_url: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Override to capture and save raw transcript data along with formatted"""
+        submission = self.submit_audio_file(item, sas_token=sas_token, base_audio_url=base_audio_url)
+        if not submission.get("session_url"):
+            return submission
+        return self.collect_transcript(submission)
+    
+    def submit_audio_file(
+        self,
+        item: Dict[str, Any],
+        sas_token: Optional[str] = None,
+        base_audio_url: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Submit one audio file to VoiceGain without waiting for the result.
+        
+        Returns the response payload; on success it carries 'session_url' (and
+        'job_id' when tracking) for collect_transcript.
+        """
         audio_path = item.get("audiopath")
         audio_url = item.get("audio_url")
         chosen_base_url = base_audio_url or item.get("base_audio_url") or self.audio_base_url
@@ -182,6 +292,8 @@ class CustomTranscriptionWorkflow(TranscriptionWorkflow):
             "status": "",
             "transcript_blob_path": None,
             "error": None,
+            "session_url": None,
+            "job_id": None,
         }
 
         try:
@@ -210,8 +322,35 @@ class CustomTranscriptionWorkflow(TranscriptionWorkflow):
             # Track the job submission (only for successful submissions)
             if TRACKING_ENABLED:
                 job_id = submit_job(audio_path or "unknown", audio_url, transcription_response)
+                response_payload["job_id"] = job_id
+
+            response_payload["session_url"] = transcription_response["sessions"][0]["sessionUrl"]
+            return response_payload
 
-            self.session_url = transcription_response["sessions"][0]["sessionUrl"]
+        except Exception as exc:  # pylint: disable=broad-except
+            response_payload["error"] = str(exc)
+            logger.exception(
+                "Error submitting audio item %s: %s",
+                audio_path or audio_url or "<unknown>",
+                exc,
+            )
+            if TRACKING_ENABLED and job_id:
+                complete_job(job_id, False, str(exc))
+            return response_payload
+    
+    def collect_transcript(self, submission: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Wait for a submitted job, then fetch, format and save its transcript.
+        
+        Takes the payload returned by submit_audio_file and returns it updated.
+        """
+        response_payload = submission
+        audio_path = response_payload.get("audio_path")
+        audio_url = response_payload.get("audio_url")
+        job_id = response_payload.get("job_id")
+
+        try:
+            self.session_url = response_payload["session_url"]
             results_phase, status = self.poll_transcription_status(self.session_url, job_id=job_id)
             response_payload["status"] = status or results_phase
 
@@ -266,20 +405,8 @@ class CustomTranscriptionWorkflow(TranscriptionWorkflow):
             return None
 
         # Sanitize the audio identifier for filename
-        sanitized_name = ""
-        if ".mp3" in audio_identifier.lower():
-            base_name = audio_identifier.replace("/", "_").replace("\\", "_").replace(".mp3", "")
-            sanitized_name = base_name + ".txt"
-        elif ".wav" in audio_identifier.lower():
-            base_name = audio_identifier.replace("/", "_").replace("\\", "_").replace(".wav", "")
-            sanitized_name = base_name + ".txt"
-        elif ".m4a" in audio_identifier.lower():
-            base_name = audio_identifier.replace("/", "_").replace("\\", "_").replace(".m4a", "")
-            sanitized_name = base_name + ".txt"
-        else:
-            # For other formats, just replace path separators and add .txt
-            base_name = audio_identifier.replace("/", "_").replace("\\", "_")
-            sanitized_name = base_name + ".txt"
+        base_name = transcript_base_name(audio_identifier)
+        sanitized_name = base_name + ".txt"
 
         container_client = self.blob_service_client.get_container_client(
             self.blob_container_name
@@ -303,11 +430,64 @@ class CustomTranscriptionWorkflow(TranscriptionWorkflow):
         return formatted_path
 
 
+def _extension_suffixes(extensions: List[str]) -> tuple:
+    """
+    Return every upper/lower case spelling of the given extensions (e.g.
+    '.mp3' -> '.mp3', '.Mp3', ..., '.MP3'), so a name can be matched with one
+    str.endswith(tuple) call without lowercasing it first.
+    """
+    return tuple({
+        "".join(chars)
+        for ext in extensions
+        for chars in itertools.product(*({ch.lower(), ch.upper()} for ch in ext))
+    })
+
+
+def _list_blob_names_sharded(
+    container_client,
+    prefix: str,
+    exclude_prefixes: tuple = ()
+) -> List[str]:
+    """
+    List blob names under a prefix, one folder at a time in parallel.
+    
+    A single delimiter listing finds the folders directly under the prefix;
+    each folder is then paged through on its own thread, since one listing
+    only ever fetches one page at a time. Folders in exclude_prefixes are not
+    listed at all. Names come back in the same order as a flat listing.
+    """
+    root_names = []
+    shard_prefixes = []
+    for item in container_client.walk_blobs(name_starts_with=prefix, delimiter="/"):
+        if isinstance(item, BlobPrefix):
+            if not item.name.startswith(exclude_prefixes):
+                shard_prefixes.append(item.name)
+        else:
+            root_names.append(item.name)
+    
+    def list_shard(shard_prefix: str) -> List[str]:
+        return list(container_client.list_blob_names(
+            name_starts_with=shard_prefix,
+            results_per_page=LISTING_PAGE_SIZE
+        ))
+    
+    names = root_names
+    with ThreadPoolExecutor(max_workers=LISTING_WORKERS) as executor:
+        for shard_names in executor.map(list_shard, shard_prefixes):
+            names.extend(shard_names)
+    # Root blobs and folders interleave in a flat listing; restore that order
+    names.sort()
+    return names
+
+
 def list_audio_files_from_blob(
     connection_string: str,
     container_name: str,
     prefix: str = "",
-    audio_extensions: Optional[List[str]] = None
+    audio_extensions: Optional[List[str]] = None,
+    max_files: Optional[int] = None,
+    transcribed: Optional[Set[str]] = None,
+    already_transcribed: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
     """
     List audio files from Azure Blob Storage container.
@@ -317,6 +497,11 @@ def list_audio_files_from_blob(
         container_name: Name of the container
         prefix: Optional prefix/folder to filter blobs
         audio_extensions: List of audio file extensions to include
+        max_files: Optional limit; listing stops once this many files are found
+        transcribed: Optional transcript base names (see list_transcribed_names);
+            audio files that already have one are skipped
+        already_transcribed: Optional list that receives the names of the
+            skipped files, e.g. so they can still be archived
         
     Returns:
         List of dictionaries with 'audiopath' keys
@@ -324,8 +509,7 @@ def list_audio_files_from_blob(
     audio_extensions = audio_extensions or [".wav", ".mp3", ".m4a"]
     
     try:
-        blob_service_client = BlobServiceClient.from_connection_string(connection_string)
-        container_client = blob_service_client.get_container_client(container_name)
+        container_client = _get_blob_service_client(connection_string).get_container_client(container_name)
         
         if not container_client.exists():
             logger.error(f"Container '{container_name}' does not exist")
@@ -334,23 +518,49 @@ def list_audio_files_from_blob(
         logger.info(f"Scanning container '{container_name}' with prefix '{prefix}' for audio files...")
         
         audio_files = []
-        blob_list = container_client.list_blobs(name_starts_with=prefix)
+        skipped = 0
         
         # Exclude files that are already processed (in Archive or Processed folders)
-        exclude_prefixes = ['Archive/', 'Processed/', 'Transcripts/']
-        
-        for blob in blob_list:
-            blob_name = blob.name.lower()
-            # Skip files in Archive, Processed, or Transcripts folders
-            if any(blob.name.startswith(exclude) for exclude in exclude_prefixes):
-                continue
-            if any(blob_name.endswith(ext) for ext in audio_extensions):
-                audio_files.append({
-                    "audiopath": blob.name,  # Use full blob name as path
-                    "source_metadata": None
-                })
+        exclude_prefixes = ('Archive/', 'Processed/', 'Transcripts/')
+        limit = max_files if max_files and max_files > 0 else None
+        # Only names are used, so skip deserializing full blob properties
+        if limit:
+            # Page through a flat listing so it can stop as soon as the limit is hit
+            blob_pages = container_client.list_blob_names(
+                name_starts_with=prefix,
+                results_per_page=LISTING_PAGE_SIZE
+            ).by_page()
+        else:
+            # Everything is needed; list folders in parallel and never list the
+            # excluded ones
+            blob_pages = [_list_blob_names_sharded(container_client, prefix, exclude_prefixes)]
+        # str.startswith/endswith accept tuples, so each test is a single call;
+        # the suffixes cover every letter case, so names are never lowercased
+        ext_tuple = _extension_suffixes(audio_extensions)
+        
+        for page in blob_pages:
+            for name in page:
+                # Skip files in Archive, Processed, or Transcripts folders
+                if name.startswith(exclude_prefixes):
+                    continue
+                if name.endswith(ext_tuple):
+                    if transcribed and transcript_base_name(name) in transcribed:
+                        skipped += 1
+                        if already_transcribed is not None:
+                            already_transcribed.append(name)
+                        continue
+                    audio_files.append({
+                        "audiopath": name,  # Use full blob name as path
+                        "source_metadata": None
+                    })
+                    if limit and len(audio_files) >= limit:
+                        break
+            if limit and len(audio_files) >= limit:
+                break
         
         logger.info(f"Found {len(audio_files)} audio files")
+        if skipped:
+            logger.info(f"Skipped {skipped} audio files that already have transcripts")
         return audio_files
         
     except Exception as e:
@@ -358,11 +568,64 @@ def list_audio_files_from_blob(
         raise
 
 
+def list_transcribed_names(
+    connection_string: str,
+    container_name: str,
+    output_folder: str = "Transcripts"
+) -> Set[str]:
+    """
+    Return the base names of formatted transcripts already in output_folder.
+    
+    Compare against transcript_base_name() of an audio blob to tell whether it
+    has been transcribed. One listing covers the whole run.
+    """
+    container_client = _get_blob_service_client(connection_string).get_container_client(container_name)
+    prefix = f"{output_folder}/formatted/"
+    return {
+        name[len(prefix):-len(".txt")]
+        for name in container_client.list_blob_names(
+            name_starts_with=prefix,
+            results_per_page=LISTING_PAGE_SIZE
+        )
+        if name.endswith(".txt")
+    }
+
+
+def generate_read_sas(
+    connection_string: str,
+    container_name: str,
+    lifetime: timedelta = timedelta(hours=24)
+) -> Optional[str]:
+    """
+    Generate a read-only SAS token for a container.
+    
+    Args:
+        connection_string: Azure Storage connection string
+        container_name: Name of the container
+        lifetime: How long the token stays valid
+        
+    Returns:
+        SAS token, or None if the connection string has no account key
+    """
+    conn_info = parse_connection_string(connection_string)
+    if not conn_info.account_key:
+        return None
+    return generate_container_sas(
+        account_name=conn_info.account_name,
+        container_name=container_name,
+        account_key=conn_info.account_key,
+        permission=ContainerSasPermissions(read=True),
+        expiry=datetime.utcnow() + lifetime
+    )
+
+
 def move_blob_to_processed(
     connection_string: str,
     container_name: str,
     blob_name: str,
-    processed_folder: str = "Archive"
+    processed_folder: str = "Archive",
+    source_sas: Optional[str] = None,
+    delete_source: bool = True
 ) -> Optional[str]:
     """
     Move a blob to the "Archive" folder after successful transcription.
@@ -372,13 +635,16 @@ def move_blob_to_processed(
         container_name: Name of the container
         blob_name: Name/path of the blob to move
         processed_folder: Folder name for archived audio files (default: "Archive")
+        source_sas: Optional read SAS for the container; enables a synchronous
+            copy (no status polling) for blobs up to SYNC_COPY_MAX_BYTES
+        delete_source: If False, only copy; the caller deletes the source
+            (e.g. in bulk with delete_blobs_batched)
         
     Returns:
         New blob path if successful, None otherwise
     """
     try:
-        blob_service_client = BlobServiceClient.from_connection_string(connection_string)
-        container_client = blob_service_client.get_container_client(container_name)
+        container_client = _get_blob_service_client(connection_string).get_container_client(container_name)
         
         # Construct new blob path in Processed folder
         # Preserve the original filename but move to Processed folder
@@ -388,33 +654,48 @@ def move_blob_to_processed(
         # Get source blob client
         source_blob_client = container_client.get_blob_client(blob_name)
         
-        # Check if source blob exists
-        if not source_blob_client.exists():
+        # Check if source blob exists (and get its size)
+        try:
+            source_props = source_blob_client.get_blob_properties()
+        except ResourceNotFoundError:
             logger.warning(f"Source blob {blob_name} does not exist, skipping move")
             return None
         
         # Get destination blob client
         dest_blob_client = container_client.get_blob_client(new_blob_path)
         
-        # Copy blob to new location
-        dest_blob_client.start_copy_from_url(source_blob_client.url)
-        
-        # Wait for copy to complete
-        copy_props = dest_blob_client.get_blob_properties()
-        max_wait_time = 30  # Maximum wait time in seconds
-        wait_time = 0
-        while copy_props.copy.status == 'pending' and wait_time < max_wait_time:
-            time.sleep(0.5)
-            wait_time += 0.5
+        if source_sas and source_props.size <= SYNC_COPY_MAX_BYTES:
+            # Put Blob From URL completes the copy within the request, so
+            # there is no copy status to poll
+            dest_blob_client.upload_blob_from_url(
+                f"{source_blob_client.url}?{source_sas}",
+                overwrite=True
+            )
+            copy_status = 'success'
+        else:
+            # Copy blob to new location
+            dest_blob_client.start_copy_from_url(source_blob_client.url)
+            
+            # Wait for copy to complete
             copy_props = dest_blob_client.get_blob_properties()
+            max_wait_time = 30  # Maximum wait time in seconds
+            wait_time = 0
+            while copy_props.copy.status == 'pending' and wait_time < max_wait_time:
+                time.sleep(0.5)
+                wait_time += 0.5
+                copy_props = dest_blob_client.get_blob_properties()
+            copy_status = copy_props.copy.status
         
-        if copy_props.copy.status == 'success':
+        if copy_status == 'success':
+            if not delete_source:
+                logger.info(f"Copied {blob_name} to {new_blob_path}")
+                return new_blob_path
             # Delete original blob after successful copy
             source_blob_client.delete_blob()
             logger.info(f"Moved {blob_name} to {new_blob_path}")
             return new_blob_path
         else:
-            logger.error(f"Failed to copy blob: {copy_props.copy.status}")
+            logger.error(f"Failed to copy blob: {copy_status}")
             return None
             
     except Exception as e:
@@ -422,6 +703,71 @@ def move_blob_to_processed(
         return None
 
 
+def _move_blob_with_retry(
+    connection_string: str,
+    container_name: str,
+    blob_name: str,
+    source_sas: Optional[str] = None,
+    delete_source: bool = True
+) -> Optional[str]:
+    """Move a blob to the archive folder, retrying with exponential backoff."""
+    for attempt in range(MOVE_MAX_ATTEMPTS):
+        processed_path = move_blob_to_processed(
+            connection_string=connection_string,
+            container_name=container_name,
+            blob_name=blob_name,
+            source_sas=source_sas,
+            delete_source=delete_source
+        )
+        if processed_path:
+            return processed_path
+        if attempt + 1 < MOVE_MAX_ATTEMPTS:
+            time.sleep(2 ** attempt)
+    logger.error(f"Giving up moving {blob_name} after {MOVE_MAX_ATTEMPTS} attempts")
+    return None
+
+
+def delete_blobs_batched(
+    connection_string: str,
+    container_name: str,
+    blob_names: List[str]
+) -> int:
+    """
+    Delete blobs with Blob Batch requests of up to DELETE_BATCH_SIZE each.
+    
+    Individual failures (e.g. a blob that is already gone) are logged and do
+    not stop the rest of the batch.
+    
+    Returns:
+        Number of blobs deleted
+    """
+    container_client = _get_blob_service_client(connection_string).get_container_client(container_name)
+    deleted = 0
+    for start in range(0, len(blob_names), DELETE_BATCH_SIZE):
+        chunk = blob_names[start:start + DELETE_BATCH_SIZE]
+        try:
+            responses = container_client.delete_blobs(*chunk, raise_on_any_failure=False)
+        except Exception as e:
+            logger.error(f"Batch delete of {len(chunk)} blobs failed: {e}")
+            continue
+        for name, response in zip(chunk, responses):
+            if 200 <= response.status_code < 300:
+                deleted += 1
+            else:
+                logger.warning(f"Could not delete source blob {name}: HTTP {response.status_code}")
+    return deleted
+
+
+@functools.lru_cache(maxsize=16)
+def _container_url_prefix(connection_string: str, container_name: str) -> str:
+    """Return the container URL (with trailing slash) that blob names are appended to."""
+    conn_info = parse_connection_string(connection_string)
+    # SAS-only connection strings carry no AccountName; the client derives it
+    # from the endpoint
+    account_name = conn_info.account_name or _get_blob_service_client(connection_string).account_name
+    return f"https://{account_name}.blob.{conn_info.endpoint_suffix}/{container_name}/"
+
+
 def generate_blob_url(
     connection_string: str,
     container_name: str,
@@ -440,37 +786,16 @@ def generate_blob_url(
     Returns:
         Full URL to the blob with SAS token
     """
-    blob_service_client = BlobServiceClient.from_connection_string(connection_string)
-    account_name = blob_service_client.account_name
-    
-    # If no SAS token provided, generate one
+    # If no SAS token provided, generate one valid for 24 hours
     if not sas_token:
-        # Get account key from connection string
-        # Parse connection string to get account key
-        conn_parts = dict(part.split('=', 1) for part in connection_string.split(';') if '=' in part)
-        account_key = conn_parts.get('AccountKey', '')
-        
-        if account_key:
-            # Generate SAS token valid for 24 hours
-            sas_token = generate_container_sas(
-                account_name=account_name,
-                container_name=container_name,
-                account_key=account_key,
-                permission=ContainerSasPermissions(read=True),
-                expiry=datetime.utcnow() + timedelta(hours=24)
-            )
+        sas_token = generate_read_sas(connection_string, container_name)
     
-    # Construct blob URL
-    blob_url = f"https://{account_name}.blob.core.windows.net/{container_name}/{blob_name}"
-    
-    # Add SAS token
-    separator = "&" if "?" in blob_url else "?"
-    blob_url = f"{blob_url}{separator}{sas_token}"
-    
-    return blob_url
+    # Percent-encode the name so '#', '?' and spaces can't end the path early;
+    # the query string is then always just the SAS token
+    return f"{_container_url_prefix(connection_string, container_name)}{quote(blob_name, safe='/')}?{sas_token}"
 
 
-def process_single_audio_file(
+def submit_single_audio_file(
     audio_file: Dict[str, Any],
     connection_string: str,
     voicegain_token: str,
@@ -480,11 +805,16 @@ def process_single_audio_file(
     audio_base_url: Optional[str],
     azure_function_url: Optional[str],
     generate_blob_urls: bool,
-    move_to_processed: bool,
     idx: int,
     total: int
-) -> Dict[str, Any]:
-    """Process a single audio file - used for parallel processing"""
+) -> Tuple[Dict[str, Any], Optional[CustomTranscriptionWorkflow], Optional[Dict[str, Any]]]:
+    """
+    Submit a single audio file to VoiceGain - used for parallel processing.
+    
+    Returns (result, workflow, submission). When the submission was accepted,
+    hand all three to collect_single_audio_file; otherwise submission is None
+    and result holds the error.
+    """
     result = {
         "audio_path": audio_file.get('audiopath'),
         "success": False,
@@ -493,7 +823,7 @@ def process_single_audio_file(
     }
     
     try:
-        logger.info(f"[{idx}/{total}] Processing: {audio_file['audiopath']}")
+        logger.info(f"[{idx}/{total}] Submitting: {audio_file['audiopath']}")
         
         # Generate blob URL if needed
         if generate_blob_urls and not audio_file.get('audio_url'):
@@ -508,7 +838,7 @@ def process_single_audio_file(
             except Exception as e:
                 logger.warning(f"Could not generate blob URL for {audio_file['audiopath']}: {e}")
                 result["error"] = f"URL generation failed: {e}"
-                return result
+                return result, None, None
         
         # Initialize workflow for this file
         workflow = CustomTranscriptionWorkflow(
@@ -520,33 +850,43 @@ def process_single_audio_file(
             output_folder=output_folder
         )
         
-        # Process the file (this will save both formatted and raw transcripts)
-        process_result = workflow.process_audio_file(
+        submission = workflow.submit_audio_file(
             item=audio_file,
             sas_token=sas_token,
             base_audio_url=audio_base_url
         )
+        if submission.get("session_url"):
+            return result, workflow, submission
         
+        result["error"] = submission.get("error") or submission.get("status") or "Unknown error"
+        logger.error(f"[{idx}/{total}] ✗ Failed: {audio_file['audiopath']} - {result['error']}")
+            
+    except Exception as e:
+        result["error"] = str(e)
+        logger.exception(f"[{idx}/{total}] Exception submitting {audio_file.get('audiopath', 'unknown')}: {e}")
+    
+    return result, None, None
+
+
+def collect_single_audio_file(
+    workflow: CustomTranscriptionWorkflow,
+    submission: Dict[str, Any],
+    result: Dict[str, Any],
+    idx: int,
+    total: int
+) -> Dict[str, Any]:
+    """Wait for a submitted file and save both formatted and raw transcripts"""
+    try:
+        process_result = workflow.collect_transcript(submission)
         if process_result.get("success"):
             result["success"] = True
             result["transcript_path"] = process_result.get('transcript_blob_path')
-            
-            # Move file to Processed folder if enabled
-            if move_to_processed:
-                processed_path = move_blob_to_processed(
-                    connection_string=connection_string,
-                    container_name=container_name,
-                    blob_name=audio_file['audiopath']
-                )
-                if processed_path:
-                    logger.info(f"[{idx}/{total}] ✓ Moved to: {processed_path}")
         else:
-            result["error"] = process_result.get("error") or process_result.get("status", "Unknown error")
-            logger.error(f"[{idx}/{total}] ✗ Failed: {audio_file['audiopath']} - {result['error']}")
-            
+            result["error"] = process_result.get("error") or process_result.get("status") or "Unknown error"
+            logger.error(f"[{idx}/{total}] ✗ Failed: {result['audio_path']} - {result['error']}")
     except Exception as e:
         result["error"] = str(e)
-        logger.exception(f"[{idx}/{total}] Exception processing {audio_file.get('audiopath', 'unknown')}: {e}")
+        logger.exception(f"[{idx}/{total}] Exception collecting {result.get('audio_path', 'unknown')}: {e}")
     
     return result
 
@@ -563,15 +903,17 @@ def process_blob_audio_files(
     generate_blob_urls: bool = True,
     max_files: Optional[int] = None,
     move_to_processed: bool = True,
-    max_workers: int = 5
+    max_workers: int = 5,
+    force: bool = False
 ):
     """
     Main function to process audio files from Azure Blob Storage.
     
-    Files are processed in batches of 200 (VoiceGain API rate limit: 1200 hrs/hr) to ensure
-    we don't exceed the maximum concurrent requests. Within each batch,
-    ALL files are processed in parallel (up to 200 simultaneous requests).
-    Batches are processed sequentially to respect API rate limits.
+    Files are processed in batches of MAX_CONCURRENCY (default 200; VoiceGain API rate
+    limit: 1200 hrs/hr) to ensure we don't exceed the maximum concurrent requests. Each
+    batch is submitted in parallel; submitted jobs are then polled and saved on a
+    collector pool, so the next batch starts submitting as soon as jobs finish instead
+    of waiting for the slowest one. At most the current batch size is in flight at once.
     
     Args:
         connection_string: Azure Storage connection string
@@ -586,6 +928,7 @@ def process_blob_audio_files(
         max_files: Optional limit on number of files to process (None = process all)
         move_to_processed: If True, move successfully processed files to "Processed" folder
         max_workers: DEPRECATED - now uses batch size (100) for parallel processing
+        force: If True, re-transcribe files that already have a transcript in output_folder
     """
     logger.info("="*80)
     logger.info("Azure Blob Transcription Processor")
@@ -596,26 +939,43 @@ def process_blob_audio_files(
     logger.info("="*80)
     logger.info("")
     
-    # List audio files from blob storage
+    # List audio files from blob storage, leaving out ones already transcribed
+    already_transcribed: List[str] = []
     try:
+        transcribed = None
+        if not force:
+            transcribed = list_transcribed_names(connection_string, container_name, output_folder)
+            logger.info(f"Found {len(transcribed)} existing transcripts in '{output_folder}'")
         audio_files = list_audio_files_from_blob(
             connection_string=connection_string,
             container_name=container_name,
-            prefix=source_prefix
+            prefix=source_prefix,
+            max_files=max_files,
+            transcribed=transcribed,
+            already_transcribed=already_transcribed
         )
     except Exception as e:
         logger.error(f"Failed to list audio files: {e}")
         return
     
-    if not audio_files:
+    # Sources with a transcript still need archiving (e.g. after an
+    # interrupted run or a failed move), so they only return early when
+    # nothing is left to do
+    if not move_to_processed:
+        already_transcribed = []
+    if not audio_files and not already_transcribed:
         logger.warning("No audio files found to process")
         return
     
-    # Limit number of files if specified
+    # Listing already stopped at max_files
     if max_files and max_files > 0:
-        audio_files = audio_files[:max_files]
         logger.info(f"Limited to processing first {len(audio_files)} files")
     
+    # Sign one container SAS for the whole run instead of one per file; the
+    # same token is handed to every batch below
+    if generate_blob_urls and not sas_token:
+        sas_token = generate_read_sas(connection_string, container_name)
+    
     # Pre-generate blob URLs for all files (can be done in parallel)
     logger.info("Generating blob URLs for all files...")
     for audio_file in audio_files:
@@ -633,7 +993,7 @@ def process_blob_audio_files(
     
     logger.info("")
     logger.info("="*80)
-    logger.info(f"Starting batched processing: 200 files per batch (with rate limiting)")
+    logger.info(f"Starting batched processing: {MAX_CONCURRENCY} files per batch (with rate limiting)")
     logger.info("="*80)
     logger.info("")
     
@@ -641,8 +1001,8 @@ def process_blob_audio_files(
     # Within each batch, files are processed with rate limiting (3750 files/hour)
     # Batches are processed sequentially to respect API limits
     # Reduced from 1500 due to high failure rate - adaptive rate limiting will adjust if needed
-    VOICEGAIN_BATCH_SIZE = 200
-    MIN_BATCH_SIZE = 10  # Minimum batch size for adaptive rate limiting
+    VOICEGAIN_BATCH_SIZE = MAX_CONCURRENCY
+    MIN_BATCH_SIZE = min(10, MAX_CONCURRENCY)  # Minimum batch size for adaptive rate limiting
     successful = 0
     failed = 0
     rate_limited = 0  # Track rate-limited requests
@@ -654,119 +1014,246 @@ def process_blob_audio_files(
     batch_429_count = 0  # Count 429 errors in current batch
     batch_total_requests = 0  # Total requests in current batch
     
-    # Process files in batches
-    num_batches = (total_files + current_batch_size - 1) // current_batch_size
+    # Archive moves are queued here as files succeed, so they overlap with
+    # the transcriptions still running instead of holding a batch worker
+    move_executor = ThreadPoolExecutor(max_workers=MOVE_WORKERS) if move_to_processed else None
+    
+    # Sources already copied to the archive wait here and are deleted
+    # DELETE_BATCH_SIZE at a time, so an interrupted run leaves few behind
+    archived_sources: List[str] = []
+    archive_lock = Lock()
+    queued_moves = 0
+    archived_count = 0
+    deleted_count = 0
+    
+    def flush_archived(final: bool = False) -> None:
+        nonlocal deleted_count
+        while True:
+            with archive_lock:
+                if len(archived_sources) < (1 if final else DELETE_BATCH_SIZE):
+                    return
+                chunk = archived_sources[:DELETE_BATCH_SIZE]
+                del archived_sources[:DELETE_BATCH_SIZE]
+            deleted = delete_blobs_batched(connection_string, container_name, chunk)
+            with archive_lock:
+                deleted_count += deleted
+    
+    def archive_source(blob_name: str, move_source_sas: Optional[str]) -> Optional[str]:
+        nonlocal archived_count
+        processed_path = _move_blob_with_retry(
+            connection_string,
+            container_name,
+            blob_name,
+            move_source_sas,
+            False  # sources are deleted in batches by flush_archived
+        )
+        if processed_path:
+            with archive_lock:
+                archived_sources.append(blob_name)
+                archived_count += 1
+            flush_archived()
+        return processed_path
+    
+    def queue_archive(blob_name: str, move_source_sas: Optional[str]) -> None:
+        nonlocal queued_moves
+        with archive_lock:
+            queued_moves += 1
+        move_executor.submit(archive_source, blob_name, move_source_sas)
+    
+    # Submitted jobs are polled and saved here, off the submitting threads.
+    # in_flight counts jobs between submission and collection and is capped
+    # at the (adaptive) current batch size
+    collect_executor = ThreadPoolExecutor(max_workers=VOICEGAIN_BATCH_SIZE)
+    collect_futures: List[Future] = []
+    in_flight = 0
+    in_flight_changed = Condition()
+    results_lock = Lock()
+    completed = 0
+    
+    def acquire_slot() -> None:
+        nonlocal in_flight
+        with in_flight_changed:
+            in_flight_changed.wait_for(lambda: in_flight < current_batch_size)
+            in_flight += 1
+    
+    def release_slot() -> None:
+        nonlocal in_flight
+        with in_flight_changed:
+            in_flight -= 1
+            in_flight_changed.notify_all()
+    
+    def collect_and_archive(workflow, submission, result, idx, move_source_sas) -> None:
+        nonlocal successful, failed, completed
+        try:
+            result = collect_single_audio_file(workflow, submission, result, idx, total_files)
+        finally:
+            release_slot()
+        with results_lock:
+            results.append(result)
+            completed += 1
+            if result["success"]:
+                successful += 1
+                logger.info(f"[Progress: {completed}/{total_files}] ✓ Success: {result['audio_path']}")
+            else:
+                failed += 1
+                logger.warning(f"[Progress: {completed}/{total_files}] ✗ Failed: {result['audio_path']}")
+        if result["success"] and move_executor:
+            queue_archive(result['audio_path'], move_source_sas)
     
-    batch_num = 0
-    batch_start = 0
+    def submit_one(audio_file, idx, move_source_sas) -> Optional[Dict[str, Any]]:
+        """Submit one file; returns its result only if it failed before collection."""
+        acquire_slot()
+        try:
+            result, workflow, submission = submit_single_audio_file(
+                audio_file,
+                connection_string,
+                voicegain_token,
+                container_name,
+                output_folder,
+                sas_token,
+                audio_base_url,
+                azure_function_url,
+                generate_blob_urls,
+                idx,
+                total_files
+            )
+        except Exception:
+            release_slot()
+            raise
+        if submission is None:
+            release_slot()
+            return result
+        collect_futures.append(collect_executor.submit(
+            collect_and_archive, workflow, submission, result, idx, move_source_sas
+        ))
+        return None
     
-    while batch_start < total_files:
-        # Recalculate number of batches with current batch size
+    try:
+        if already_transcribed:
+            logger.info(f"Archiving {len(already_transcribed)} already transcribed source files")
+            transcribed_sas = generate_read_sas(connection_string, container_name, MOVE_SAS_LIFETIME)
+            for blob_name in already_transcribed:
+                queue_archive(blob_name, transcribed_sas)
+        
+        # Process files in batches
         num_batches = (total_files + current_batch_size - 1) // current_batch_size
-        batch_end = min(batch_start + current_batch_size, total_files)
-        batch_files = audio_files[batch_start:batch_end]
-        batch_size = len(batch_files)
+    
+        batch_num = 0
+        batch_start = 0
+    
+        while batch_start < total_files:
+            # Recalculate number of batches with current batch size
+            num_batches = (total_files + current_batch_size - 1) // current_batch_size
+            batch_end = min(batch_start + current_batch_size, total_files)
+            batch_files = audio_files[batch_start:batch_end]
+            batch_size = len(batch_files)
         
-        # Reset batch statistics
-        batch_429_count = 0
-        batch_total_requests = 0
+            # Reset batch statistics
+            batch_429_count = 0
+            batch_total_requests = 0
         
-        logger.info("")
-        logger.info(f"Processing batch {batch_num + 1}/{num_batches} (items {batch_start + 1}-{batch_end} of {total_files}, batch size: {current_batch_size})")
-        logger.info("-" * 80)
-        
-        # Process ALL items in this batch in parallel
-        # Use max_workers equal to batch size to process all items simultaneously
-        batch_workers = min(batch_size, current_batch_size)
-        with ThreadPoolExecutor(max_workers=batch_workers) as executor:
-            # Submit all tasks for this batch
-            future_to_file = {
-                executor.submit(
-                    process_single_audio_file,
-                    audio_file,
-                    connection_string,
-                    voicegain_token,
-                    container_name,
-                    output_folder,
-                    sas_token,
-                    audio_base_url,
-                    azure_function_url,
-                    generate_blob_urls,
-                    move_to_processed,
-                    batch_start + idx + 1,
-                    total_files
-                ): audio_file
-                for idx, audio_file in enumerate(batch_files)
-            }
+            # One short-lived SAS authorizes the synchronous archive copies of
+            # this batch
+            move_source_sas = (
+                generate_read_sas(connection_string, container_name, MOVE_SAS_LIFETIME)
+                if move_to_processed
+                else None
+            )
+        
+            logger.info("")
+            logger.info(f"Processing batch {batch_num + 1}/{num_batches} (items {batch_start + 1}-{batch_end} of {total_files}, batch size: {current_batch_size})")
+            logger.info("-" * 80)
+        
+            # Submit ALL items in this batch in parallel; accepted jobs move on to
+            # the collector pool, so this only waits for submissions
+            batch_workers = min(batch_size, current_batch_size)
+            with ThreadPoolExecutor(max_workers=batch_workers) as executor:
+                future_to_file = {
+                    executor.submit(submit_one, audio_file, batch_start + idx + 1, move_source_sas): audio_file
+                    for idx, audio_file in enumerate(batch_files)
+                }
             
-            # Process completed tasks as they finish
-            batch_completed = 0
-            for future in as_completed(future_to_file):
-                audio_file = future_to_file[future]
-                try:
-                    result = future.result()
-                    results.append(result)
+                # Record submissions that failed as they finish
+                batch_completed = 0
+                for future in as_completed(future_to_file):
+                    audio_file = future_to_file[future]
                     batch_completed += 1
                     batch_total_requests += 1
-                    completed = batch_start + batch_completed
-                    
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.exception(f"Exception in parallel processing for {audio_file.get('audiopath', 'unknown')}: {e}")
+                        result = {
+                            "audio_path": audio_file.get('audiopath'),
+                            "success": False,
+                            "error": str(e)
+                        }
+                    if result is None:
+                        continue  # submitted; the collector records the outcome
+                
                     # Track rate-limited requests
                     if result.get("status") == "rate_limited" or (result.get("error") and "rate" in result.get("error", "").lower()):
                         rate_limited += 1
                         batch_429_count += 1
-                    
-                    if result.get("success"):
-                        successful += 1
-                        logger.info(f"[Progress: {completed}/{total_files}] ✓ Success: {audio_file.get('audiopath', 'unknown')}")
-                    else:
+                
+                    with results_lock:
+                        results.append(result)
                         failed += 1
+                        completed += 1
                         logger.warning(f"[Progress: {completed}/{total_files}] ✗ Failed: {audio_file.get('audiopath', 'unknown')}")
-                except Exception as e:
-                    failed += 1
-                    batch_completed += 1
-                    batch_total_requests += 1
-                    completed = batch_start + batch_completed
-                    logger.exception(f"[Progress: {completed}/{total_files}] Exception in parallel processing for {audio_file.get('audiopath', 'unknown')}: {e}")
-                    results.append({
-                        "audio_path": audio_file.get('audiopath'),
-                        "success": False,
-                        "error": str(e)
-                    })
         
-        # Adaptive rate limiting: adjust batch size based on 429 error rate
-        rate_429_percentage = 0.0
-        if batch_total_requests > 0:
-            rate_429_percentage = (batch_429_count / batch_total_requests) * 100
-            if rate_429_percentage > 5.0:  # If more than 5% of requests are rate-limited
-                # Reduce batch size by 25% (minimum MIN_BATCH_SIZE)
-                new_batch_size = max(MIN_BATCH_SIZE, int(current_batch_size * 0.75))
-                if new_batch_size < current_batch_size:
-                    logger.warning(
-                        f"Rate limiting detected: {rate_429_percentage:.1f}% of requests rate-limited. "
-                        f"Reducing batch size from {current_batch_size} to {new_batch_size}"
-                    )
-                    current_batch_size = new_batch_size
-            elif rate_429_percentage == 0.0 and current_batch_size < VOICEGAIN_BATCH_SIZE:
-                # Gradually increase batch size if no rate limiting (up to original size)
-                new_batch_size = min(VOICEGAIN_BATCH_SIZE, int(current_batch_size * 1.1))
-                if new_batch_size > current_batch_size:
-                    logger.info(
-                        f"No rate limiting detected. Increasing batch size from {current_batch_size} to {new_batch_size}"
-                    )
-                    current_batch_size = new_batch_size
-        
-        # Wait for batch to complete before starting next batch
-        logger.info(
-            f"Completed batch {batch_num + 1} - {batch_completed} items processed "
-            f"(429 errors: {batch_429_count}/{batch_total_requests}, {rate_429_percentage:.1f}%)"
-        )
+            # Adaptive rate limiting: adjust batch size based on 429 error rate
+            rate_429_percentage = 0.0
+            if batch_total_requests > 0:
+                rate_429_percentage = (batch_429_count / batch_total_requests) * 100
+                if rate_429_percentage > 5.0:  # If more than 5% of requests are rate-limited
+                    # Reduce batch size by 25% (minimum MIN_BATCH_SIZE)
+                    new_batch_size = max(MIN_BATCH_SIZE, int(current_batch_size * 0.75))
+                    if new_batch_size < current_batch_size:
+                        logger.warning(
+                            f"Rate limiting detected: {rate_429_percentage:.1f}% of requests rate-limited. "
+                            f"Reducing batch size from {current_batch_size} to {new_batch_size}"
+                        )
+                        current_batch_size = new_batch_size
+                elif rate_429_percentage == 0.0 and current_batch_size < VOICEGAIN_BATCH_SIZE:
+                    # Gradually increase batch size if no rate limiting (up to original size)
+                    new_batch_size = min(VOICEGAIN_BATCH_SIZE, int(current_batch_size * 1.1))
+                    if new_batch_size > current_batch_size:
+                        logger.info(
+                            f"No rate limiting detected. Increasing batch size from {current_batch_size} to {new_batch_size}"
+                        )
+                        current_batch_size = new_batch_size
         
-        batch_num += 1
-        batch_start = batch_end
+            logger.info(
+                f"Submitted batch {batch_num + 1} - {batch_completed} items "
+                f"(429 errors: {batch_429_count}/{batch_total_requests}, {rate_429_percentage:.1f}%)"
+            )
+        
+            batch_num += 1
+            batch_start = batch_end
         
-        if batch_start < total_files:  # Don't wait after last batch
-            logger.info("Waiting 10 seconds before starting next batch...")
-            time.sleep(10)  # Delay between batches to give VoiceGain time to process requests
+            if batch_start < total_files:  # Don't wait after last batch
+                logger.info("Waiting 10 seconds before starting next batch...")
+                time.sleep(10)  # Delay between batches to give VoiceGain time to process requests
+    
+        # Let submitted transcriptions finish before reporting
+        if collect_futures:
+            logger.info(f"Waiting for {len(collect_futures)} submitted transcriptions to finish...")
+            wait(collect_futures)
+    finally:
+        # On an interrupted run, jobs still being collected are abandoned
+        collect_executor.shutdown(wait=False)
+        # Let queued archive moves finish, then delete the last partial batch
+        if move_executor:
+            if queued_moves:
+                logger.info(f"Waiting for {queued_moves} archive moves to finish...")
+            move_executor.shutdown(wait=True)
+            flush_archived(final=True)
+            if queued_moves:
+                logger.info(
+                    f"Archived {archived_count}/{queued_moves} source files "
+                    f"({deleted_count} originals removed)"
+                )
     
     # Summary
     logger.info("")
@@ -867,6 +1354,8 @@ def main():
     AZURE_FUNCTION_URL = os.getenv("AZURE_FUNCTION_URL")  # Optional Azure Function URL
     MAX_FILES = os.getenv("MAX_FILES")  # Optional limit on number of files to process
     MAX_FILES = int(MAX_FILES) if MAX_FILES else None
+    # Re-transcribe files that already have transcripts (--force or FORCE_RETRANSCRIBE=true)
+    FORCE = "--force" in sys.argv[1:] or os.getenv("FORCE_RETRANSCRIBE", "").lower() in ("1", "true", "yes")
     # Note: max_workers parameter is now deprecated - batch processing uses 200 parallel workers per batch
     # This matches the VoiceGain API rate limit of 1200 hrs/hr (increased from 100 hrs/hr)
     
@@ -882,7 +1371,8 @@ def main():
         azure_function_url=AZURE_FUNCTION_URL,
         max_files=MAX_FILES,
         move_to_processed=True,  # Move successfully processed files to Processed folder
-        max_workers=4000  # Process all 4000 items in batch in parallel
+        max_workers=4000,  # Process all 4000 items in batch in parallel
+        force=FORCE
     )
 
 
@@ -241,9 +241,9 @@ def test_blob_file_transcription(blob_connection_string: str, container_name: st
             logger.info("Let's check the raw transcript data from VoiceGain...")
             
             # Try to get the raw transcript data
-            if hasattr(workflow, 'session_url') and workflow.session_url:
+            if result.get('session_url'):
                 try:
-                    raw_transcript = workflow.get_transcript(workflow.session_url)
+                    raw_transcript = workflow.get_transcript(result['session_url'])
                     logger.info("")
                     logger.info("Raw transcript data from VoiceGain:")
                     logger.info(json.dumps(raw_transcript, indent=2))